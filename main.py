@@ -5,95 +5,207 @@ rclone-copy: Secondary backup copy using rclone with cron-based scheduling.
 Main entry point for the backup application.
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import functools
+import io
 import logging
+import os
 import sys
+import threading
 import time
 import urllib.parse
-import urllib.request
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from python_utils.email_utils import send_backup_notification
-from python_utils.logging_utils import setup_backup_logging
-from src.backup_manager import BackupManager, BackupResult
-from src.config import AppConfig, load_config
-from src.schedule_checker import ScheduleChecker
+from src.formatting import estimate_transfer_time, format_duration, format_size
 
+# Application modules are imported where they are used, so argument-only
+# invocations such as --help don't pay for yaml/pydantic/python_utils imports
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-def send_uptime_kuma_notification(
-    status: str, message: str, logger: logging.Logger | None = None
-) -> None:
+    import requests
+
+    from src.backup_manager import BackupResult
+    from src.config import AppConfig
+
+_KUMA_BASE_URL = "http://localhost:3001/api/push/MhyfEdOgdA"
+
+# Module-level logger; replaced by the configured one once setup_logging() runs
+logger: logging.Logger = logging.getLogger("rclone-copy")
+logger.addHandler(logging.NullHandler())
+
+_CONSOLE_FORMATTER = logging.Formatter("%(asctime)s %(levelname)-8s %(message)s")
+
+_LOG_BUFFER_SIZE = 64 * 1024
+
+_GIB = 1 << 30
+
+_SUMMARY_BUF = threading.local()
+
+_PREFLIGHT_FAILURE_HEADER = (
+    "=== Rclone Backup - Pre-flight Check Failures ===\n\n"
+    "The following errors prevented backups from starting:\n"
+)
+
+_NO_BACKUPS_SUMMARY = (
+    "=== Rclone Backup Summary ===\n\nNo backups were scheduled to run today."
+)
+
+
+@functools.cache
+def _kuma_session() -> requests.Session:
     """
-    Send notification to Uptime Kuma monitoring service.
+    Shared HTTP session for Uptime Kuma pushes.
 
-    Args:
-        status: Either "up" for success or "down" for failure
-        message: Simple message like "OK" or "FAILED"
-        logger: Optional logger instance for error logging
+    Keeps the connection alive between pushes and retries transient failures
+    with exponential backoff instead of blocking on a fixed delay.
     """
-    base_url = "http://localhost:3001/api/push/MhyfEdOgdA"
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(max_retries=retry))
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
 
+@functools.lru_cache(maxsize=4)
+def _kuma_url(status: str, message: str) -> str:
+    """Build the push URL; only a handful of (status, msg) pairs are ever used."""
     # Build query parameters
     params = {
         "status": status,
         "msg": message,
         "ping": "",  # Empty ping parameter as specified
     }
+    return f"{_KUMA_BASE_URL}?{urllib.parse.urlencode(params)}"
 
-    # Construct full URL
-    query_string = urllib.parse.urlencode(params)
-    full_url = f"{base_url}?{query_string}"
 
-    def _make_request(url: str) -> bool:
-        """Make HTTP request, return True on success, False on failure."""
-        try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                # Any successful HTTP response is considered success
-                if response.getcode() < 400:
-                    return True
-                else:
-                    if logger:
-                        logger.warning(
-                            f"Uptime Kuma notification failed with HTTP {response.getcode()}"
-                        )
-                    return False
-        except Exception as e:
-            if logger:
-                logger.warning(f"Uptime Kuma notification failed: {e}")
-            return False
-
-    # First attempt
-    if _make_request(full_url):
-        # Success on first try
+def send_uptime_kuma_notification(
+    status: str, message: str, logger: logging.Logger | None = None
+) -> None:
+    """
+    Send notification to Uptime Kuma monitoring service.
+
+    Args:
+        status: Either "up" for success or "down" for failure
+        message: Simple message like "OK" or "FAILED"
+        logger: Optional logger instance for error logging
+    """
+    try:
+        response = _kuma_session().get(_kuma_url(status, message), timeout=10)
+    except Exception as e:
         if logger:
-            logger.debug(
-                f"Uptime Kuma notification sent successfully: status={status}, msg={message}"
-            )
+            logger.warning("Uptime Kuma notification failed: %s", e)
         return
 
-    # First attempt failed, wait 2 minutes and retry
-    if logger:
-        logger.info("Uptime Kuma notification failed, retrying in 2 minutes...")
-
-    time.sleep(120)  # 2 minutes
-
-    # Second attempt
-    if _make_request(full_url):
+    # Any successful HTTP response is considered success
+    if response.status_code < 400:
         if logger:
-            logger.info(
-                f"Uptime Kuma notification sent successfully on retry: status={status}, msg={message}"
+            logger.debug(
+                "Uptime Kuma notification sent successfully: status=%s, msg=%s",
+                status,
+                message,
             )
     else:
         if logger:
-            logger.error("Uptime Kuma notification failed on retry, giving up")
+            logger.warning(
+                "Uptime Kuma notification failed with HTTP %s", response.status_code
+            )
+
+
+class DeferredFlushFileHandler(logging.FileHandler):
+    """File handler that buffers records and leaves flushing to shutdown."""
+
+    def __init__(self, filename: str, encoding: str | None = None):
+        super().__init__(filename, mode="a", encoding=encoding)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=_LOG_BUFFER_SIZE,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record without the per-record flush of StreamHandler."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _buffer_file_handlers(target: logging.Logger) -> None:
+    """Give the logger's file handlers a 64 KiB write buffer."""
+    for handler in list(target.handlers):
+        if type(handler) is logging.FileHandler:
+            # Plain file handlers are swapped for one that only flushes at shutdown
+            deferred = DeferredFlushFileHandler(
+                handler.baseFilename, encoding=handler.encoding
+            )
+            deferred.setLevel(handler.level)
+            deferred.setFormatter(handler.formatter)
+            for log_filter in handler.filters:
+                deferred.addFilter(log_filter)
+            target.removeHandler(handler)
+            handler.close()
+            target.addHandler(deferred)
+        elif isinstance(handler, logging.FileHandler):
+            # Subclasses (e.g. rotating handlers) keep their own emit logic;
+            # always append: reopening with the handler's own mode could truncate
+            stream = open(
+                handler.baseFilename,
+                "a",
+                encoding=handler.encoding,
+                buffering=_LOG_BUFFER_SIZE,
+            )
+            previous = handler.setStream(stream)
+            if previous is not None:
+                previous.close()
+
+
+def _flush_log_handlers() -> None:
+    """Flush buffered log output to disk."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+atexit.register(_flush_log_handlers)
+
+# Uptime Kuma pushes run in the background so main() can return while a push
+# is still retrying; the interpreter waits for pending pushes on exit
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="uptime-kuma")
+atexit.register(_NOTIFY_POOL.shutdown, wait=True)
 
 
 def setup_logging(config: AppConfig, cli_mode: bool = False) -> logging.Logger:
     """Set up logging configuration."""
+    from python_utils.logging_utils import setup_backup_logging
+
     log_file_path = Path(config.log_file)
     log_dir = log_file_path.parent
-    log_dir.mkdir(parents=True, exist_ok=True)
+    # A single stat in the common case where the directory already exists
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
 
     if cli_mode:
         # In CLI mode, log to both console and file
@@ -104,11 +216,14 @@ def setup_logging(config: AppConfig, cli_mode: bool = False) -> logging.Logger:
             redirect_streams=False,  # Don't redirect streams in CLI mode to allow console output
         )
 
-        # Add console handler for CLI mode
-        console_handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter("%(asctime)s %(levelname)-8s %(message)s")
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        # Add console handler for CLI mode, unless one already writes to stdout
+        if not any(
+            isinstance(h, logging.StreamHandler) and h.stream is sys.stdout
+            for h in logger.handlers
+        ):
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            logger.addHandler(console_handler)
 
     else:
         # Cron mode: file only (existing behavior)
@@ -119,46 +234,82 @@ def setup_logging(config: AppConfig, cli_mode: bool = False) -> logging.Logger:
             redirect_streams=True,
         )
 
+    # Batch log writes; buffered records are flushed at exit (up to 64 KiB
+    # may be lost on a hard crash - the summary also goes out by email)
+    _buffer_file_handlers(logger)
+
     return logger
 
 
+class SummaryStats(NamedTuple):
+    """Formatted backup summary together with the totals it reports."""
+
+    text: str
+    successful: int
+    failed: int
+    total_bytes: int
+
+
+def _format_result(result: BackupResult) -> str:
+    """Format the summary block for a single backup result."""
+    if result.success:
+        date_str = (
+            f"\n  Latest file date: {result.latest_file_date:%Y-%m-%d %H:%M:%S}"
+            if result.latest_file_date
+            else ""
+        )
+        detail = f"  Bytes transferred: {result.bytes_transferred:,}{date_str}"
+    else:
+        detail = f"  Error: {result.error_message}"
+
+    return (
+        f"\n[{'✓ SUCCESS' if result.success else '✗ FAILED'}] {result.backup_name}\n"
+        f"  Execution time: {result.execution_time:.2f} seconds\n"
+        f"{detail}"
+    )
+
+
 def format_backup_summary(
     results: list[BackupResult], total_execution_time: float
-) -> str:
+) -> SummaryStats:
     """Format backup results into a readable summary."""
-    summary = []
-    summary.append("=== Rclone Backup Summary ===\n")
+    # Reuse this thread's buffer across calls instead of a fresh list of lines
+    buf = getattr(_SUMMARY_BUF, "io", None) or io.StringIO()
+    buf.seek(0)
+    buf.truncate()
+    _SUMMARY_BUF.io = buf
 
-    successful_count = sum(1 for r in results if r.success)
-    failed_count = len(results) - successful_count
-    total_bytes = sum(r.bytes_transferred for r in results if r.success)
+    successful_count = 0
+    total_bytes = 0
 
-    summary.append(f"Total backups processed: {len(results)}")
-    summary.append(f"Successful: {successful_count}")
-    summary.append(f"Failed: {failed_count}")
-    summary.append(
-        f"Total bytes transferred: {total_bytes:,} bytes ({total_bytes / (1024**3):.2f} GB)"
-    )
-    summary.append(f"Total execution time: {total_execution_time:.2f} seconds")
-    summary.append("")
-
-    # Individual backup details
-    summary.append("=== Individual Backup Results ===")
+    # Single pass: accumulate totals and write the per-result blocks together
     for result in results:
-        status = "✓ SUCCESS" if result.success else "✗ FAILED"
-        summary.append(f"\n[{status}] {result.backup_name}")
-        summary.append(f"  Execution time: {result.execution_time:.2f} seconds")
-
         if result.success:
-            summary.append(f"  Bytes transferred: {result.bytes_transferred:,}")
-            if result.latest_file_date:
-                summary.append(
-                    f"  Latest file date: {result.latest_file_date.strftime('%Y-%m-%d %H:%M:%S')}"
-                )
-        else:
-            summary.append(f"  Error: {result.error_message}")
+            successful_count += 1
+            total_bytes += result.bytes_transferred
+        buf.write("\n")
+        buf.write(_format_result(result))
 
-    return "\n".join(summary)
+    failed_count = len(results) - successful_count
+
+    header = (
+        "=== Rclone Backup Summary ===\n\n"
+        f"Total backups processed: {len(results)}\n"
+        f"Successful: {successful_count}\n"
+        f"Failed: {failed_count}\n"
+        f"Total bytes transferred: {total_bytes:,} bytes "
+        f"({total_bytes / _GIB:.2f} GB)\n"
+        f"Total execution time: {total_execution_time:.2f} seconds\n"
+        "\n"
+        "=== Individual Backup Results ==="
+    )
+
+    return SummaryStats(
+        text=header + buf.getvalue(),
+        successful=successful_count,
+        failed=failed_count,
+        total_bytes=total_bytes,
+    )
 
 
 def send_email_notification(config: AppConfig, summary: str, has_errors: bool) -> None:
@@ -167,9 +318,7 @@ def send_email_notification(config: AppConfig, summary: str, has_errors: bool) -
         return
 
     try:
-        subject = "Rclone Backup Summary"
-        if has_errors:
-            subject += " - WITH ERRORS"
+        from python_utils.email_utils import send_backup_notification
 
         # Use python_utils email notification
         send_backup_notification(
@@ -179,14 +328,14 @@ def send_email_notification(config: AppConfig, summary: str, has_errors: bool) -
             config_to_emails=config.email,
         )
 
-        logging.info(f"Email notification sent to: {', '.join(config.email)}")
+        logging.info("Email notification sent to: %s", ", ".join(config.email))
 
     except Exception as e:
-        logging.error(f"Failed to send email notification: {e}")
+        logging.error("Failed to send email notification: %s", e)
 
 
-def parse_arguments() -> tuple[str | None, bool]:
-    """Parse command line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Backup files using rclone or local filesystem",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -212,14 +361,67 @@ Examples:
         help="Calculate backup size and list files without copying",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_arguments() -> tuple[str | None, bool]:
+    """Parse command line arguments."""
+    args = _PARSER.parse_args()
     return args.destination, args.dry_run
 
 
-def run_dry_run_mode(backup_manager, config, logger) -> int:
-    """Execute dry run mode."""
-    from src.backup_manager import estimate_transfer_time, format_duration, format_size
+# Log output words some overview rows differently from the console
+_LOG_LABELS = {
+    "Successful": "Successful analyses",
+    "Failed": "Failed analyses",
+    "Estimated time": "Estimated duration",
+}
+
+
+def _iter_summary_rows(
+    summary, dest_type: str | None = None
+) -> Iterator[tuple[str, str]]:
+    """
+    Yield the (label, value) overview rows shared by all dry-run reports.
+
+    The transfer estimate is only included when dest_type is given.
+    """
+    yield "Total backups", str(summary.total_backups)
+    yield "Successful", str(summary.successful_backups)
+    yield "Failed", str(summary.failed_backups)
+    yield "Total files", f"{summary.total_files:,}"
+    yield "Total size", format_size(summary.total_size)
+
+    if dest_type and summary.total_size > 0:
+        est_time = estimate_transfer_time(summary.total_size, dest_type)
+        yield "Estimated time", format_duration(est_time)
+
+
+def _guess_dest_type(summary) -> str:
+    """Guess "local" or "remote" from the destinations of successful results."""
+    return (
+        "local"
+        if any(
+            "/mnt" in r.destination or "/home" in r.destination
+            for r in summary.results
+            if r.success
+        )
+        else "remote"
+    )
+
 
+def _write_lines(lines: list[str]) -> None:
+    """Write lines to stdout with a single write and flush."""
+    lines.append("")  # Trailing newline, as print() would add
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
+
+
+def run_dry_run_mode(backup_manager, config, logger, is_tty: bool = False) -> int:
+    """Execute dry run mode; is_tty selects console output over log output."""
     logger.info("Running in DRY RUN mode - no files will be copied")
 
     # Get all backup items (skip schedule filtering for dry run)
@@ -233,57 +435,67 @@ def run_dry_run_mode(backup_manager, config, logger) -> int:
     summary = backup_manager.run_all_backups_dry_run(backup_list)
 
     # Simple output for now
-    if sys.stdout.isatty():
-        # Interactive mode - console output
-        print("\n=== DRY RUN SUMMARY ===")
-        print(f"Total backups: {summary.total_backups}")
-        print(f"Successful: {summary.successful_backups}")
-        print(f"Failed: {summary.failed_backups}")
-        print(f"Total files: {summary.total_files:,}")
-        print(f"Total size: {format_size(summary.total_size)}")
-
-        if summary.total_size > 0:
-            dest_type = "local" if backup_manager.local_destination else "remote"
-            est_time = estimate_transfer_time(summary.total_size, dest_type)
-            print(f"Estimated time: {format_duration(est_time)}")
-
-        print("\nBackup Details:")
+    if is_tty:
+        # Interactive mode - console output, written in one go
+        dest_type = "local" if backup_manager.local_destination else "remote"
+        lines = ["\n=== DRY RUN SUMMARY ==="]
+        lines.extend(
+            f"{label}: {value}"
+            for label, value in _iter_summary_rows(summary, dest_type)
+        )
+
+        lines.append("\nBackup Details:")
         for result in summary.results:
             status = "✅" if result.success else "❌"
             if result.success:
-                print(
+                lines.append(
                     f"  {status} {result.backup_name}: {result.total_files} files, {format_size(result.total_size)}"
                 )
             else:
-                print(f"  {status} {result.backup_name}: {result.error_message}")
+                lines.append(f"  {status} {result.backup_name}: {result.error_message}")
+
+        _write_lines(lines)
     else:
         # Cron mode - log output
         logger.info("=== DRY RUN SUMMARY ===")
-        logger.info(f"Total backups: {summary.total_backups}")
-        logger.info(f"Successful analyses: {summary.successful_backups}")
-        logger.info(f"Failed analyses: {summary.failed_backups}")
-        logger.info(f"Total files: {summary.total_files:,}")
-        logger.info(f"Total size: {format_size(summary.total_size)}")
+        for label, value in _iter_summary_rows(summary):
+            logger.info("%s: %s", _LOG_LABELS.get(label, label), value)
 
         for result in summary.results:
             if result.success:
                 logger.info(
-                    f"✅ {result.backup_name}: {result.total_files} files, {format_size(result.total_size)}"
+                    "✅ %s: %d files, %s",
+                    result.backup_name,
+                    result.total_files,
+                    format_size(result.total_size),
                 )
             else:
-                logger.error(f"❌ {result.backup_name}: {result.error_message}")
+                logger.error("❌ %s: %s", result.backup_name, result.error_message)
 
     return 0
 
 
 def main() -> int:
     """Main application entry point."""
-    start_time = datetime.now()
+    global logger
+    start_monotonic = time.monotonic()
+    is_tty = sys.stdout.isatty()  # Checked once; stdout doesn't change mid-run
+
+    # Uptime Kuma only monitors rclone mode (not local or dry-run); the status
+    # is pushed once from the finally block, whichever way main() exits
+    monitored = False
+    kuma_status = ("down", "FAILED")
+    backup_manager = None
 
     try:
         # Parse command line arguments
         local_destination, dry_run = parse_arguments()
         cli_mode = local_destination is not None or dry_run
+        monitored = local_destination is None and not dry_run
+
+        from src.backup_manager import BackupManager
+        from src.config import load_config
+        from src.schedule_checker import ScheduleChecker
 
         # Load configuration
         config = load_config("config.yaml")
@@ -292,14 +504,14 @@ def main() -> int:
         logger = setup_logging(config, cli_mode=cli_mode)
         if local_destination:
             logger.info("Starting backup process in LOCAL FILESYSTEM mode")
-            logger.info(f"Destination: {local_destination}")
+            logger.info("Destination: %s", local_destination)
         elif dry_run:
             logger.info("Starting backup process in DRY RUN mode")
         else:
             logger.info("Starting rclone-copy backup process")
 
         logger.info(
-            f"Configuration loaded with {len(config.backup_copy_list)} backup items"
+            "Configuration loaded with %d backup items", len(config.backup_copy_list)
         )
 
         # Filter backups that should run today (skip schedule filtering in local mode)
@@ -311,34 +523,37 @@ def main() -> int:
             )
         else:
             # Rclone mode: filter by schedule
-            scheduled_backups = ScheduleChecker.get_scheduled_backups(
-                config.backup_copy_list
+            scheduled_backups = list(
+                ScheduleChecker.iter_scheduled(config.backup_copy_list)
             )
 
-            # Log information about rclone-disabled backups
-            disabled_backups = [
-                item for item in config.backup_copy_list if not item.rclone_enabled
-            ]
-            if disabled_backups:
-                disabled_names = [item.name for item in disabled_backups]
-                logger.info(
-                    f"Skipping {len(disabled_backups)} rclone-disabled backups: {disabled_names}"
-                )
+            # Log information about rclone-disabled backups; the scan is only
+            # worth doing when the record will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                disabled_names = [
+                    item.name
+                    for item in config.backup_copy_list
+                    if not item.rclone_enabled
+                ]
+                if disabled_names:
+                    logger.info(
+                        "Skipping %d rclone-disabled backups: %s",
+                        len(disabled_names),
+                        disabled_names,
+                    )
 
             if not scheduled_backups:
                 logger.info("No backups scheduled to run today")
                 # Still send a notification if configured
                 if config.email:
-                    summary = "=== Rclone Backup Summary ===\n\nNo backups were scheduled to run today."
-                    send_email_notification(config, summary, has_errors=False)
-                # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-                if local_destination is None and not dry_run:
-                    send_uptime_kuma_notification("up", "OK", logger)
-
+                    send_email_notification(
+                        config, _NO_BACKUPS_SUMMARY, has_errors=False
+                    )
+                kuma_status = ("up", "OK")
                 return 0
 
             logger.info(
-                f"Found {len(scheduled_backups)} backups scheduled to run today"
+                "Found %d backups scheduled to run today", len(scheduled_backups)
             )
 
         # Initialize backup manager
@@ -348,49 +563,46 @@ def main() -> int:
 
         # Handle dry run mode
         if dry_run:
-            return run_dry_run_mode(backup_manager, config, logger)
+            return run_dry_run_mode(backup_manager, config, logger, is_tty)
 
         # Perform pre-flight checks
         logger.info("Performing pre-flight checks...")
         preflight_errors = backup_manager.perform_preflight_checks(scheduled_backups)
 
         if preflight_errors:
-            logger.critical("Pre-flight checks failed:")
-            for error in preflight_errors:
-                logger.critical(f"  - {error}")
-
-            # Send error notification
-            error_summary = "=== Rclone Backup - Pre-flight Check Failures ===\n\n"
-            error_summary += "The following errors prevented backups from starting:\n\n"
-            error_summary += "\n".join(f"• {error}" for error in preflight_errors)
+            # One record for all errors: a single handler write instead of one per error
+            if logger.isEnabledFor(logging.CRITICAL):
+                logger.critical(
+                    "Pre-flight checks failed:\n%s",
+                    "\n".join(f"  - {error}" for error in preflight_errors),
+                )
 
+            # Send error notification (built in one join, only when it will be sent)
             if config.email:
+                error_summary = "\n".join(
+                    [_PREFLIGHT_FAILURE_HEADER]
+                    + [f"• {error}" for error in preflight_errors]
+                )
                 send_email_notification(config, error_summary, has_errors=True)
 
-            # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-            if local_destination is None and not dry_run:
-                send_uptime_kuma_notification("down", "FAILED", logger)
-
             return 1
 
         logger.info("Pre-flight checks passed")
 
-        # Execute backups
-        results = []
-        for backup_item in scheduled_backups:
-            logger.info(f"Processing backup: {backup_item.name}")
-            result = backup_manager.create_backup(backup_item)
-            results.append(result)
+        # Execute backups (results keep the scheduled order)
+        results = backup_manager.create_backups(
+            scheduled_backups, max_parallel=config.max_parallel_backups
+        )
 
         # Calculate total execution time
-        total_execution_time = (datetime.now() - start_time).total_seconds()
+        total_execution_time = time.monotonic() - start_monotonic
 
         # Generate summary
-        summary = format_backup_summary(results, total_execution_time)
-        logger.info("\n" + summary)
-
-        # Check if there were any errors
-        has_errors = any(not result.success for result in results)
+        stats = format_backup_summary(results, total_execution_time)
+        summary = stats.text
+        has_errors = stats.failed > 0
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", summary)
 
         # Send email notification
         if config.email:
@@ -399,87 +611,44 @@ def main() -> int:
         # Return appropriate exit code
         if has_errors:
             logger.warning("Some backups failed - check logs for details")
-            # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-            if local_destination is None and not dry_run:
-                send_uptime_kuma_notification("down", "FAILED", logger)
-
             return 2
         else:
             logger.info("All backups completed successfully")
-            # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-            if local_destination is None and not dry_run:
-                send_uptime_kuma_notification("up", "OK", logger)
-
+            kuma_status = ("up", "OK")
             return 0
 
     except FileNotFoundError as e:
         error_msg = f"Configuration file error: {e}"
         print(f"ERROR: {error_msg}", file=sys.stderr)
-        if "logger" in locals():
-            logger.critical(error_msg)
-        # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-        if (
-            "local_destination" in locals()
-            and local_destination is None
-            and "dry_run" in locals()
-            and not dry_run
-        ):
-            send_uptime_kuma_notification("down", "FAILED", logger)
-
+        logger.critical(error_msg)
         return 1
 
     except ValueError as e:
         error_msg = f"Configuration validation error: {e}"
         print(f"ERROR: {error_msg}", file=sys.stderr)
-        if "logger" in locals():
-            logger.critical(error_msg)
-        # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-        if (
-            "local_destination" in locals()
-            and local_destination is None
-            and "dry_run" in locals()
-            and not dry_run
-        ):
-            send_uptime_kuma_notification("down", "FAILED", logger)
-
+        logger.critical(error_msg)
         return 1
 
     except KeyboardInterrupt:
         error_msg = "Backup process interrupted by user"
         print(f"\nINTERRUPTED: {error_msg}", file=sys.stderr)
-        if "logger" in locals():
-            logger.warning(error_msg)
-        # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-        if (
-            "local_destination" in locals()
-            and local_destination is None
-            and "dry_run" in locals()
-            and not dry_run
-        ):
-            send_uptime_kuma_notification("down", "FAILED", logger)
-
+        logger.warning(error_msg)
         return 130
 
     except Exception as e:
         error_msg = f"Unexpected error: {e}"
         print(f"ERROR: {error_msg}", file=sys.stderr)
-        if "logger" in locals():
-            logger.critical(error_msg, exc_info=True)
-        # Send Uptime Kuma notification (only in rclone mode, not dry-run)
-        if (
-            "local_destination" in locals()
-            and local_destination is None
-            and "dry_run" in locals()
-            and not dry_run
-        ):
-            send_uptime_kuma_notification("down", "FAILED", logger)
-
+        logger.critical(error_msg, exc_info=True)
         return 1
 
     finally:
-        if "logger" in locals():
-            total_time = (datetime.now() - start_time).total_seconds()
-            logger.info(f"Backup process completed in {total_time:.2f} seconds")
+        if backup_manager is not None:
+            backup_manager.close()
+        if monitored:
+            _NOTIFY_POOL.submit(send_uptime_kuma_notification, *kuma_status, logger)
+        total_time = time.monotonic() - start_monotonic
+        logger.info("Backup process completed in %.2f seconds", total_time)
+        _flush_log_handlers()
 
 
 if __name__ == "__main__":
@@ -487,57 +656,36 @@ if __name__ == "__main__":
     sys.exit(exit_code)
 
 
+_BOX_WIDTH = 64
+
+# The box shows counts per backup below, so it leaves out the tallies
+_BOX_SKIPPED_ROWS = frozenset({"Successful", "Failed"})
+
+
+def _box_line(text: str = "", wide_chars: int = 0) -> str:
+    """Pad text into a dry-run box row; wide_chars counts double-width emoji."""
+    return f"│{text:<{_BOX_WIDTH - wide_chars}}│"
+
+
 def print_dry_run_summary(summary, detailed: bool = False) -> None:
     """Print formatted dry run summary to console."""
-    from src.backup_manager import estimate_transfer_time, format_duration, format_size
-
-    print("╭─── Backup Dry Run Summary " + "─" * 40 + "╮")
-    print("│" + " " * 64 + "│")
-    print("│ 📊 OVERVIEW" + " " * 51 + "│")
-    print(
-        f"│   • Total backups: {summary.total_backups}"
-        + " " * (49 - len(str(summary.total_backups)))
-        + "│"
-    )
-    print(
-        f"│   • Total files: {summary.total_files:,}"
-        + " " * (51 - len(f"{summary.total_files:,}"))
-        + "│"
-    )
-    print(
-        f"│   • Total size: {format_size(summary.total_size)}"
-        + " " * (52 - len(format_size(summary.total_size)))
-        + "│"
+    lines = [
+        f"╭─── Backup Dry Run Summary {'─' * (_BOX_WIDTH - 27)}╮",
+        _box_line(),
+        _box_line(" 📊 OVERVIEW", wide_chars=1),
+    ]
+    lines.extend(
+        _box_line(f"   • {label}: {value}")
+        for label, value in _iter_summary_rows(summary, _guess_dest_type(summary))
+        if label not in _BOX_SKIPPED_ROWS
     )
 
-    # Estimate transfer time
-    if summary.total_size > 0:
-        dest_type = (
-            "local"
-            if any(
-                "/mnt" in r.destination or "/home" in r.destination
-                for r in summary.results
-                if r.success
-            )
-            else "remote"
-        )
-        est_time = estimate_transfer_time(summary.total_size, dest_type)
-        print(
-            f"│   • Estimated time: {format_duration(est_time)}"
-            + " " * (48 - len(format_duration(est_time)))
-            + "│"
-        )
-
-    print("│" + " " * 64 + "│")
-    print("│ 📁 BACKUP DETAILS" + " " * 47 + "│")
+    lines.append(_box_line())
+    lines.append(_box_line(" 📁 BACKUP DETAILS", wide_chars=1))
 
     for result in summary.results:
         status = "✅" if result.success else "❌"
-        print(
-            f"│   {result.backup_name} ({status})"
-            + " " * (59 - len(result.backup_name))
-            + "│"
-        )
+        lines.append(_box_line(f"   {result.backup_name} ({status})", wide_chars=1))
         if result.success:
             size_info = f"{result.total_files} files, {format_size(result.total_size)}"
             dest_short = (
@@ -545,93 +693,87 @@ def print_dry_run_summary(summary, detailed: bool = False) -> None:
                 if "/" in result.destination
                 else result.destination
             )
-            print(
-                f"│     └─ {size_info} → {dest_short}"
-                + " " * (59 - len(f"{size_info} → {dest_short}"))
-                + "│"
-            )
+            lines.append(_box_line(f"     └─ {size_info} → {dest_short}"))
         else:
-            print(f"│     └─ Error: {result.error_message[:40]}..." + " " * (15) + "│")
+            lines.append(_box_line(f"     └─ Error: {result.error_message[:40]}..."))
 
-    print("│" + " " * 64 + "│")
-    print("╰" + "─" * 64 + "╯")
+    lines.append(_box_line())
+    lines.append(f"╰{'─' * _BOX_WIDTH}╯")
 
     if detailed and summary.total_backups > 0:
-        print("\n📋 DETAILED FILE ANALYSIS")
+        lines.append("\n📋 DETAILED FILE ANALYSIS")
         for result in summary.results:
             if result.success:
-                print_detailed_file_list(result)
+                lines.extend(_detailed_file_lines(result))
 
+    # One write for the whole report instead of one print per row
+    _write_lines(lines)
 
-def print_detailed_file_list(result) -> None:
-    """Print detailed file listing for a backup."""
-    from src.backup_manager import format_size
 
-    print(f"\n📁 {result.backup_name} → {result.destination}")
-    print(
-        f"Files to copy ({result.total_files} total, {format_size(result.total_size)}):"
-    )
+def _detailed_file_lines(result) -> list[str]:
+    """Build the detailed file listing rows for a backup."""
+    lines = [
+        f"\n📁 {result.backup_name} → {result.destination}",
+        f"Files to copy ({result.total_files} total, "
+        f"{format_size(result.total_size)}):",
+    ]
 
     if result.filtered_files:
-        print("┌" + "─" * 50 + "┬" + "─" * 10 + "┐")
-        print("│" + "File Path".ljust(50) + "│" + "Size".ljust(10) + "│")
-        print("├" + "─" * 50 + "┼" + "─" * 10 + "┤")
-
-        # Show first 10 files
-        for i, file_path in enumerate(result.filtered_files[:10]):
-            if file_path.exists():
-                size = format_size(file_path.stat().st_size)
-                path_str = str(file_path)
-                if len(path_str) > 48:
-                    path_str = "..." + path_str[-45:]
-                print("│" + path_str.ljust(50) + "│" + size.ljust(10) + "│")
+        lines.append("┌" + "─" * 50 + "┬" + "─" * 10 + "┐")
+        lines.append("│" + "File Path".ljust(50) + "│" + "Size".ljust(10) + "│")
+        lines.append("├" + "─" * 50 + "┼" + "─" * 10 + "┤")
+
+        # Show first 10 files; one stat per file, no separate exists() check
+        for file_path in result.filtered_files[:10]:
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
+                continue
+            size = format_size(file_size)
+            path_str = str(file_path)
+            if len(path_str) > 48:
+                path_str = "..." + path_str[-45:]
+            lines.append("│" + path_str.ljust(50) + "│" + size.ljust(10) + "│")
 
         if len(result.filtered_files) > 10:
             remaining = len(result.filtered_files) - 10
-            print(
+            lines.append(
                 "│" + f"... and {remaining} more files".ljust(50) + "│" + " " * 10 + "│"
             )
 
-        print("└" + "─" * 50 + "┴" + "─" * 10 + "┘")
+        lines.append("└" + "─" * 50 + "┴" + "─" * 10 + "┘")
 
-    if result.excluded_files:
-        print(f"\nExcluded files ({len(result.excluded_files)} total):")
+    if result.excluded_count:
+        lines.append(f"\nExcluded files ({result.excluded_count} total):")
+        # Paths are only present when the analysis was asked to keep them
         for file_path in result.excluded_files[:5]:  # Show first 5 excluded files
-            print(f"• {file_path}")
-        if len(result.excluded_files) > 5:
-            print(f"• ... and {len(result.excluded_files) - 5} more excluded files")
+            lines.append(f"• {file_path}")
+        if result.excluded_files and result.excluded_count > 5:
+            lines.append(f"• ... and {result.excluded_count - 5} more excluded files")
+
+    return lines
+
+
+def print_detailed_file_list(result) -> None:
+    """Print detailed file listing for a backup."""
+    _write_lines(_detailed_file_lines(result))
 
 
 def log_dry_run_summary(summary, logger) -> None:
     """Log dry run results in structured format for cron jobs."""
-    from src.backup_manager import estimate_transfer_time, format_duration, format_size
-
     logger.info("=== DRY RUN SUMMARY ===")
-    logger.info(f"Total backups: {summary.total_backups}")
-    logger.info(f"Successful analyses: {summary.successful_backups}")
-    logger.info(f"Failed analyses: {summary.failed_backups}")
-    logger.info(f"Total files: {summary.total_files:,}")
-    logger.info(f"Total size: {format_size(summary.total_size)}")
-
-    if summary.total_size > 0:
-        dest_type = (
-            "local"
-            if any(
-                "/mnt" in r.destination or "/home" in r.destination
-                for r in summary.results
-                if r.success
-            )
-            else "remote"
-        )
-        est_time = estimate_transfer_time(summary.total_size, dest_type)
-        logger.info(f"Estimated duration: {format_duration(est_time)}")
+    for label, value in _iter_summary_rows(summary, _guess_dest_type(summary)):
+        logger.info("%s: %s", _LOG_LABELS.get(label, label), value)
 
     logger.info("=== INDIVIDUAL BACKUP ANALYSIS ===")
     for result in summary.results:
         if result.success:
             logger.info(
-                f"✅ {result.backup_name}: {result.total_files} files, "
-                f"{format_size(result.total_size)} → {result.destination}"
+                "✅ %s: %d files, %s → %s",
+                result.backup_name,
+                result.total_files,
+                format_size(result.total_size),
+                result.destination,
             )
         else:
-            logger.error(f"❌ {result.backup_name}: {result.error_message}")
+            logger.error("❌ %s: %s", result.backup_name, result.error_message)
@@ -1,24 +1,71 @@
 """Core backup management functionality using rclone."""
 
-import json
+import atexit
 import logging
+import os
+import re
+import secrets
 import shutil
+import socket
 import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
 
-from python_utils.filesystem_utils import (
-    calculate_total_size,
-    get_files_modified_within_days,
-    is_directory_accessible,
-)
+import requests
+
+from python_utils.filesystem_utils import is_directory_accessible
 
 from .config import AppConfig, BackupItem
+from .formatting import format_size
+
+# Prefer orjson's C parser for rclone's JSON output; fall back to the stdlib
+try:
+    from orjson import JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import JSONDecodeError
+    from json import loads as json_loads
+
+# Backup directory timestamp suffix, as written by strftime("%Y-%m-%d_%H-%M");
+# zero-padded, so these sort chronologically as plain strings
+_TS_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}_[0-9]{2}-[0-9]{2}")
+
+# Seconds to wait for the rclone rc server to accept requests
+_RC_START_TIMEOUT = 10.0
+
+# Seconds an 'rclone about' result stays valid
+_REMOTE_INFO_TTL = 30.0
+
+# rclone copy runs are killed after this many seconds
+_COPY_TIMEOUT = 3600  # 1 hour
+# Non-stats stderr lines kept for the error message of a failed copy
+_STDERR_TAIL_LINES = 50
+
+# Average file sizes that switch rclone between small- and large-file tuning
+_SMALL_FILE_SIZE = 1 << 20  # 1 MiB
+_LARGE_FILE_SIZE = 100 << 20  # 100 MiB
 
 
 class BackupResult:
     """Result of a backup operation."""
 
+    __slots__ = (
+        "backup_name",
+        "success",
+        "bytes_transferred",
+        "error_message",
+        "execution_time",
+        "latest_file_date",
+    )
+
     def __init__(
         self,
         backup_name: str,
@@ -39,6 +86,19 @@ class BackupResult:
 class DryRunResult:
     """Result of a dry run operation."""
 
+    __slots__ = (
+        "backup_name",
+        "source_dir",
+        "destination",
+        "total_files",
+        "total_size",
+        "filtered_files",
+        "excluded_files",
+        "excluded_count",
+        "error_message",
+        "success",
+    )
+
     def __init__(
         self,
         backup_name: str,
@@ -46,10 +106,11 @@ class DryRunResult:
         destination: str,
         total_files: int = 0,
         total_size: int = 0,
-        filtered_files: list[Path] | None = None,
-        excluded_files: list[Path] | None = None,
+        filtered_files: list[str] | None = None,
+        excluded_files: list[str] | None = None,
         error_message: str = "",
         success: bool = True,
+        excluded_count: int | None = None,
     ):
         self.backup_name = backup_name
         self.source_dir = source_dir
@@ -58,6 +119,10 @@ class DryRunResult:
         self.total_size = total_size
         self.filtered_files = filtered_files or []
         self.excluded_files = excluded_files or []
+        # Excluded paths are optional; the count is always known
+        self.excluded_count = (
+            len(self.excluded_files) if excluded_count is None else excluded_count
+        )
         self.error_message = error_message
         self.success = success
 
@@ -65,11 +130,19 @@ class DryRunResult:
 class DryRunSummary:
     """Summary of all dry run operations."""
 
+    __slots__ = ("results", "_successful", "_total_files", "_total_size")
+
     def __init__(
         self,
         results: list[DryRunResult] | None = None,
     ):
-        self.results = results or []
+        self.results = []
+        # Aggregates are kept up to date by add_result(), so reading them is O(1)
+        self._successful = 0
+        self._total_files = 0
+        self._total_size = 0
+        for result in results or []:
+            self.add_result(result)
 
     @property
     def total_backups(self) -> int:
@@ -79,152 +152,362 @@ class DryRunSummary:
     @property
     def successful_backups(self) -> int:
         """Number of successful backup analyses."""
-        return sum(1 for r in self.results if r.success)
+        return self._successful
 
     @property
     def failed_backups(self) -> int:
         """Number of failed backup analyses."""
-        return sum(1 for r in self.results if not r.success)
+        return len(self.results) - self._successful
 
     @property
     def total_files(self) -> int:
         """Total number of files across all backups."""
-        return sum(r.total_files for r in self.results if r.success)
+        return self._total_files
 
     @property
     def total_size(self) -> int:
         """Total size in bytes across all backups."""
-        return sum(r.total_size for r in self.results if r.success)
+        return self._total_size
 
     def add_result(self, result: DryRunResult) -> None:
         """Add a dry run result to the summary."""
         self.results.append(result)
+        if result.success:
+            self._successful += 1
+            self._total_files += result.total_files
+            self._total_size += result.total_size
 
 
-def analyze_backup_files(
-    source_dir: str, max_age_days: int = 0, max_size_bytes: int = 0
-) -> tuple[list[Path], list[Path], int]:
+def _fast_copy(src: str, dst: str | Path) -> int:
     """
-    Analyze files that would be included in backup.
+    Copy a file with its metadata and return the number of bytes copied.
+
+    Data goes through os.copy_file_range, which stays in the kernel and can
+    become a reflink on Btrfs/XFS. Where that is unavailable or rejected
+    (e.g. across filesystems on older kernels) shutil.copyfile is used,
+    which itself uses sendfile on Linux.
+    """
+    copied = None
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                copied = 0
+                while n := os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    copied += n
+                # Some filesystems (procfs-like, some FUSE/overlay mounts) return
+                # 0 for a non-empty file instead of failing
+                if not copied and os.fstat(fsrc.fileno()).st_size > 0:
+                    copied = None
+            except OSError:
+                copied = None
+            if copied is None:
+                # Drop any partial data before the fallback rewrites dst
+                fdst.truncate(0)
+
+    if copied is None:
+        shutil.copyfile(src, dst)
+        copied = os.path.getsize(dst)
+
+    shutil.copystat(src, dst)
+    return copied
+
+
+def _link_or_copy(src: str, dst: str, size: int, mtime: float, prior: str) -> int:
+    """
+    Hard-link prior to dst if it matches src's size and mtime, else copy.
+
+    Returns the number of bytes copied, 0 for a link. prior comes from a
+    backup written by _fast_copy, which preserves mtimes, so an unchanged
+    file compares equal.
+    """
+    # An existing dst may share its inode with older backups; writing
+    # through it would change those too
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        st = os.stat(prior)
+        if st.st_size == size and st.st_mtime == mtime:
+            os.link(prior, dst)
+            return 0
+    except OSError:
+        # Missing in the previous backup, or links unsupported/cross-device
+        pass
+    return _fast_copy(src, dst)
+
+
+def _timestamped_dirs(dir_names: list[str], backup_name: str) -> list[tuple[str, str]]:
+    """Return (dir_name, timestamp) for each '<backup_name>_<timestamp>' entry."""
+    prefix = f"{backup_name}_"
+    prefix_len = len(prefix)
+    backup_dirs = []
+    for dir_name in dir_names:
+        if not dir_name.startswith(prefix):
+            continue
+        # Validate timestamp format (an empty suffix never matches)
+        timestamp_part = dir_name[prefix_len:]
+        if _TS_RE.fullmatch(timestamp_part):
+            backup_dirs.append((dir_name, timestamp_part))
+    return backup_dirs
+
+
+class ScanResult(NamedTuple):
+    """Age-filtered files of a source directory, shared by checks and backups."""
+
+    files: list[str]
+    total_size: int
+    max_mtime: float | None
+
+
+def iter_backup_candidates(
+    source_dir: str,
+    max_age_days: int = 0,
+    max_size_bytes: int = 0,
+    on_excluded: Callable[[str], None] | None = None,
+) -> Iterator[tuple[str, int, float]]:
+    """
+    Yield (path, size, mtime) for each file that passes the backup filters.
+
+    Files are produced as the directory walk finds them, so callers can start
+    work before the scan finishes. Excluded files, including ones that
+    cannot be stat'ed, are reported through on_excluded if given.
 
     Args:
         source_dir: Source directory path
         max_age_days: Maximum age of files in days (0 = no limit)
         max_size_bytes: Maximum total backup size (0 = no limit)
-
-    Returns:
-        - files_to_copy: List of files that pass filters
-        - excluded_files: List of files excluded by filters
-        - total_size: Total size of files to copy
+        on_excluded: Called with the path of each excluded file
     """
-    source_path = Path(source_dir)
-    if not source_path.exists() or not source_path.is_dir():
-        return [], [], 0
+    if not os.path.isdir(source_dir):
+        return
 
-    files_to_copy = []
-    excluded_files = []
-    total_size = 0
     current_backup_size = 0
 
-    # Get cutoff date for max_age filter
-    cutoff_date = None
+    # Get cutoff timestamp for max_age filter; compared against st_mtime directly
+    cutoff_timestamp = None
     if max_age_days > 0:
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        cutoff_timestamp = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+
+    # Depth-first walk with os.scandir: DirEntry caches the type from readdir,
+    # so only regular files need a stat call. Each directory's files come
+    # before its subdirectories, and symlinked directories are not followed.
+    stack = [source_dir]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError as e:
+            if dir_path is source_dir:
+                # Handle directory access errors
+                logging.getLogger(__name__).warning(
+                    f"Cannot access directory {source_dir}: {e}"
+                )
+                return
+            continue  # Unreadable subdirectories are skipped, as rglob does
 
-    try:
-        # Walk through all files in source directory
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
+        subdirs = []
+        with entries:
+            for entry in entries:
                 try:
-                    file_stat = file_path.stat()
-                    file_size = file_stat.st_size
-                    file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
-
-                    # Check age filter
-                    if cutoff_date and file_mtime < cutoff_date:
-                        excluded_files.append(file_path)
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
                         continue
-
-                    # Check size limit
-                    if (
-                        max_size_bytes > 0
-                        and (current_backup_size + file_size) > max_size_bytes
-                    ):
-                        excluded_files.append(file_path)
+                    if not entry.is_file():
                         continue
+                    file_stat = entry.stat()
+                except OSError:
+                    # Skip files we can't access
+                    if on_excluded:
+                        on_excluded(entry.path)
+                    continue
 
-                    # File passes all filters
-                    files_to_copy.append(file_path)
-                    total_size += file_size
-                    current_backup_size += file_size
+                file_size = file_stat.st_size
 
-                except (OSError, PermissionError):
-                    # Skip files we can't access
-                    excluded_files.append(file_path)
+                # Check age filter
+                if cutoff_timestamp and file_stat.st_mtime < cutoff_timestamp:
+                    if on_excluded:
+                        on_excluded(entry.path)
                     continue
 
-    except (OSError, PermissionError) as e:
-        # Handle directory access errors
-        logging.getLogger(__name__).warning(
-            f"Cannot access directory {source_dir}: {e}"
-        )
-        return [], [], 0
+                # Check size limit
+                if (
+                    max_size_bytes > 0
+                    and (current_backup_size + file_size) > max_size_bytes
+                ):
+                    if on_excluded:
+                        on_excluded(entry.path)
+                    continue
 
-    return files_to_copy, excluded_files, total_size
+                # File passes all filters
+                current_backup_size += file_size
+                yield entry.path, file_size, file_stat.st_mtime
 
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
 
-def estimate_transfer_time(total_size: int, destination_type: str = "remote") -> float:
+
+def analyze_backup_files(
+    source_dir: str,
+    max_age_days: int = 0,
+    max_size_bytes: int = 0,
+    include_excluded_paths: bool = False,
+) -> tuple[list[str], list[str], int, int, float | None]:
     """
-    Estimate transfer time based on size and destination type.
+    Analyze files that would be included in backup.
 
     Args:
-        total_size: Total size in bytes
-        destination_type: "remote" or "local"
+        source_dir: Source directory path
+        max_age_days: Maximum age of files in days (0 = no limit)
+        max_size_bytes: Maximum total backup size (0 = no limit)
+        include_excluded_paths: Also collect the paths of excluded files;
+            otherwise they are only counted
 
     Returns:
-        Estimated time in seconds
+        - files_to_copy: List of file paths that pass filters
+        - excluded_files: Excluded file paths (empty unless requested)
+        - excluded_count: Number of files excluded by filters
+        - total_size: Total size of files to copy
+        - max_mtime: Newest modification time among files to copy, or None
     """
-    if total_size == 0:
-        return 0.0
+    files_to_copy = []
+    excluded_files = []
+    excluded_count = 0
+    total_size = 0
+    max_mtime = None
 
-    # Transfer rate estimates (bytes per second)
-    if destination_type == "local":
-        # Local disk transfer (SSD/HDD average)
-        rate_bps = 50 * 1024 * 1024  # 50 MB/s
-    else:
-        # Remote transfer (internet upload)
-        rate_bps = 5 * 1024 * 1024  # 5 MB/s (conservative estimate)
+    def on_excluded(path: str) -> None:
+        nonlocal excluded_count
+        excluded_count += 1
+        if include_excluded_paths:
+            excluded_files.append(path)
 
-    return total_size / rate_bps
+    for file_path, file_size, file_mtime in iter_backup_candidates(
+        source_dir, max_age_days, max_size_bytes, on_excluded
+    ):
+        files_to_copy.append(file_path)
+        total_size += file_size
+        if max_mtime is None or file_mtime > max_mtime:
+            max_mtime = file_mtime
 
+    return files_to_copy, excluded_files, excluded_count, total_size, max_mtime
 
-def format_size(size_bytes: int) -> str:
-    """Format byte size in human-readable format."""
-    if size_bytes == 0:
-        return "0 B"
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            if unit == "B":
-                return f"{size_bytes} {unit}"
-            else:
-                return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
+class _RcloneRCError(Exception):
+    """An rc method ran but reported an error (the CLI's non-zero exit)."""
+
 
-    return f"{size_bytes:.1f} PB"
+class _RcloneRC:
+    """
+    A private 'rclone rcd' server for the quick rclone calls.
+
+    The server starts on first use and answers version, about, list and purge
+    over local HTTP, so those calls don't each pay for starting rclone. It
+    listens on 127.0.0.1 with a random password, passed through the
+    environment so it doesn't show up in the process list. call() returns
+    None whenever the server is unavailable, and callers then use the CLI.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._session: requests.Session | None = None
+        self._url = ""
+        self._unavailable = False
+
+    def call(self, method: str, timeout: float = 60, **params) -> dict | None:
+        """Run an rc method; raise _RcloneRCError if it fails, None if no server."""
+        server = self._ensure_started()
+        if server is None:
+            return None
+        # Locals: another thread may tear the server down meanwhile, and
+        # then this request just fails like any unreachable server
+        session, url = server
+        try:
+            response = session.post(f"{url}{method}", json=params, timeout=timeout)
+        except requests.RequestException as e:
+            self.logger.warning(f"rclone rc server unreachable, using CLI: {e}")
+            with self._lock:
+                self._unavailable = True
+                self._stop_locked()
+            return None
+
+        try:
+            reply = response.json()
+        except ValueError:
+            reply = {}
+        if response.status_code != 200:
+            raise _RcloneRCError(reply.get("error") or f"HTTP {response.status_code}")
+        return reply
+
+    def _ensure_started(self) -> tuple[requests.Session, str] | None:
+        """Start the server if needed; return its (session, url), or None."""
+        with self._lock:
+            if self._proc is None and not self._unavailable:
+                self._unavailable = not self._start()
+            if self._unavailable or self._session is None:
+                return None
+            return self._session, self._url
+
+    def _start(self) -> bool:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        password = secrets.token_urlsafe(24)
+        env = {
+            **os.environ,
+            "RCLONE_RC_USER": "rclone-copy",
+            "RCLONE_RC_PASS": password,
+        }
+        try:
+            self._proc = subprocess.Popen(
+                ["rclone", "rcd", f"--rc-addr=127.0.0.1:{port}"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+            )
+        except OSError as e:
+            self.logger.warning(f"Could not start rclone rc server, using CLI: {e}")
+            return False
+        atexit.register(self.stop)
 
+        self._session = requests.Session()
+        self._session.auth = ("rclone-copy", password)
+        self._url = f"http://127.0.0.1:{port}/"
 
-def format_duration(seconds: float) -> str:
-    """Format duration in human-readable format."""
-    if seconds < 60:
-        return f"{seconds:.0f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.0f}m {seconds % 60:.0f}s"
-    else:
-        hours = seconds / 3600
-        minutes = (seconds % 3600) / 60
-        return f"{hours:.0f}h {minutes:.0f}m"
+        # Wait for the server to accept requests
+        deadline = time.monotonic() + _RC_START_TIMEOUT
+        while time.monotonic() < deadline and self._proc.poll() is None:
+            try:
+                self._session.post(f"{self._url}rc/noop", json={}, timeout=1)
+                self.logger.debug(f"rclone rc server listening on port {port}")
+                return True
+            except requests.RequestException:
+                time.sleep(0.1)
+
+        self.logger.warning("rclone rc server did not start, using CLI")
+        self._stop_locked()
+        return False
+
+    def stop(self) -> None:
+        """Shut the server down; safe to call more than once."""
+        with self._lock:
+            self._stop_locked()
+
+    def _stop_locked(self) -> None:
+        # Caller holds self._lock
+        proc, self._proc = self._proc, None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
 
 
 class RcloneManager:
@@ -233,9 +516,36 @@ class RcloneManager:
     def __init__(self, config: AppConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Results of 'rclone version' and 'rclone about', so repeated checks
+        # don't spawn rclone again
+        self._installed: bool | None = None
+        self._remote_info_cache: dict[str, tuple[float, dict]] = {}
+        self._remote_info_lock = threading.Lock()
+        # Directory names per listed remote path. Copies and deletes made
+        # through this manager keep the entries current, so backups sharing
+        # a parent path list it only once per run
+        self._dir_cache: dict[str, list[str]] = {}
+        self._dir_cache_lock = threading.Lock()
+        self._rc = _RcloneRC(self.logger) if config.rclone.rc_server else None
+
+    def close(self) -> None:
+        """Stop the rclone rc server, if one was started."""
+        if self._rc is not None:
+            self._rc.stop()
 
     def validate_rclone_installation(self) -> bool:
-        """Check if rclone is installed and accessible."""
+        """Check if rclone is installed and accessible (checked once)."""
+        if self._installed is None:
+            self._installed = self._check_installation()
+        return self._installed
+
+    def _check_installation(self) -> bool:
+        if self._rc is not None:
+            try:
+                if self._rc.call("core/version", timeout=30) is not None:
+                    return True
+            except _RcloneRCError:
+                return False
         try:
             result = subprocess.run(
                 ["rclone", "version"],
@@ -252,26 +562,53 @@ class RcloneManager:
             return False
 
     def get_remote_info(self, remote_name: str) -> dict | None:
-        """Get information about a remote using 'rclone about'."""
+        """
+        Get information about a remote using 'rclone about'.
+
+        Successful results are reused for _REMOTE_INFO_TTL seconds.
+        """
+        with self._remote_info_lock:
+            cached = self._remote_info_cache.get(remote_name)
+        if cached is not None and time.monotonic() - cached[0] < _REMOTE_INFO_TTL:
+            return cached[1]
+
+        remote_info = self._fetch_remote_info(remote_name)
+        if remote_info is not None:
+            with self._remote_info_lock:
+                self._remote_info_cache[remote_name] = (time.monotonic(), remote_info)
+        return remote_info
+
+    def _fetch_remote_info(self, remote_name: str) -> dict | None:
+        if self._rc is not None:
+            try:
+                remote_info = self._rc.call("operations/about", fs=f"{remote_name}:")
+            except _RcloneRCError as e:
+                self.logger.error(
+                    f"rclone about failed for remote '{remote_name}': {e}"
+                )
+                return None
+            if remote_info is not None:
+                return remote_info
         try:
             result = subprocess.run(
                 ["rclone", "about", f"{remote_name}:", "--json"],
                 capture_output=True,
-                text=True,
                 timeout=60,
             )
 
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                # Parsed straight from bytes; no separate decode step
+                return json_loads(result.stdout)
             else:
+                stderr = result.stderr.decode(errors="replace")
                 self.logger.error(
-                    f"rclone about failed for remote '{remote_name}': {result.stderr}"
+                    f"rclone about failed for remote '{remote_name}': {stderr}"
                 )
                 return None
 
         except (
             subprocess.TimeoutExpired,
-            json.JSONDecodeError,
+            JSONDecodeError,
             subprocess.SubprocessError,
         ) as e:
             self.logger.error(f"Error getting remote info for '{remote_name}': {e}")
@@ -295,15 +632,61 @@ class RcloneManager:
 
         return True
 
+    def _tuning_flags(self, avg_file_size: float | None = None) -> list[str]:
+        """
+        Build the rclone concurrency flags for one copy.
+
+        Options set in the config win. Otherwise many small files get more
+        files in flight, and a few large files get more streams per file.
+        """
+        transfers, checkers, streams = 8, 16, 4
+        if avg_file_size is not None:
+            if avg_file_size < _SMALL_FILE_SIZE:
+                transfers, checkers = 16, 32
+            elif avg_file_size > _LARGE_FILE_SIZE:
+                transfers, streams = 4, 8
+
+        options = self.config.rclone
+        if options.multi_thread_streams is not None:
+            streams = options.multi_thread_streams
+
+        flags = [
+            "--transfers",
+            str(options.transfers or transfers),
+            "--checkers",
+            str(options.checkers or checkers),
+            "--multi-thread-streams",
+            str(streams),
+            "--multi-thread-cutoff",
+            options.multi_thread_cutoff,
+        ]
+        if options.buffer_size is not None:
+            flags.extend(["--buffer-size", options.buffer_size])
+        if options.fast_list:
+            flags.append("--fast-list")
+        return flags
+
     def copy_to_remote(
-        self, source_dir: str, destination: str, max_age_days: int = 0
+        self,
+        source_dir: str,
+        destination: str,
+        max_age_days: int = 0,
+        avg_file_size: float | None = None,
+        files_list: list[str] | None = None,
     ) -> tuple[bool, int, str]:
         """
         Copy files from source to remote destination using rclone.
 
+        avg_file_size, when known from a prior scan, picks the default
+        concurrency flags (see _tuning_flags). files_list, the scanned paths
+        under source_dir, is handed to rclone as a manifest so it does not
+        walk the source again, unless it is empty or a name in it contains a
+        newline.
+
         Returns:
             Tuple of (success, bytes_transferred, error_message)
         """
+        manifest = None
         try:
             # Build rclone command
             cmd = [
@@ -311,101 +694,226 @@ class RcloneManager:
                 "copy",
                 source_dir,
                 destination,
-                "--progress",
-                "--stats-one-line",
-                "--stats=1s",
-                "--create-empty-src-dirs",
+                # Machine-readable logs; stats records carry a "stats" object
+                "--use-json-log",
+                "--stats=5s",
+                "--stats-log-level=NOTICE",
                 "--exclude",
                 ".recycle/**",
+                *self._tuning_flags(avg_file_size),
             ]
 
             # Add age filter if specified
             if max_age_days > 0:
                 cmd.extend(["--max-age", f"{max_age_days}d"])
 
+            # --files-from-raw has one name per line, so it cannot carry a name
+            # containing a newline; and an empty manifest creates nothing on
+            # the remote. Let rclone walk the source in both cases.
+            if files_list and not any("\n" in path for path in files_list):
+                manifest = self._write_manifest(source_dir, files_list)
+                # The destination is a fresh timestamped dir, so there is
+                # nothing there worth listing either
+                cmd.extend(["--files-from-raw", manifest, "--no-traverse"])
+            else:
+                # Only meaningful when rclone walks the source itself
+                cmd.append("--create-empty-src-dirs")
+
             self.logger.info(f"Running rclone command: {' '.join(cmd)}")
 
-            result = subprocess.run(
+            # Stream stderr instead of buffering it: a stats record is logged
+            # every few seconds, and only the latest byte count matters
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=3600,  # 1 hour timeout
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
             )
+            timed_out = threading.Event()
 
-            if result.returncode == 0:
-                # Parse output to get bytes transferred
-                bytes_transferred = self._parse_rclone_output(result.stderr)
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                proc.kill()
+
+            # Reading the stream blocks, so the timeout is enforced by a timer
+            watchdog = threading.Timer(_COPY_TIMEOUT, kill_on_timeout)
+            watchdog.start()
+
+            bytes_transferred = 0
+            files_transferred = 0
+            stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+            try:
+                with proc.stderr:
+                    for line in proc.stderr:
+                        record = self._parse_log_line(line)
+                        stats = record.get("stats")
+                        if stats is not None:
+                            bytes_transferred = int(stats.get("bytes", 0))
+                            files_transferred = int(stats.get("transfers", 0))
+                        else:
+                            text = self._format_log_record(record)
+                            stderr_tail.append(f"{text}\n")
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+
+            if timed_out.is_set():
+                error_msg = "rclone copy operation timed out"
+                self.logger.error(error_msg)
+                return False, 0, error_msg
+
+            if returncode == 0:
+                if files_transferred:
+                    self._update_dir_cache(destination, present=True)
+                else:
+                    # rclone may not have created the destination at all, so
+                    # drop the parent listing and let the next use relist it
+                    parent = destination.rstrip("/").rpartition("/")[0]
+                    with self._dir_cache_lock:
+                        self._dir_cache.pop(parent, None)
                 return True, bytes_transferred, ""
             else:
-                error_msg = f"rclone copy failed: {result.stderr}"
+                error_msg = f"rclone copy failed: {''.join(stderr_tail)}"
                 self.logger.error(error_msg)
                 return False, 0, error_msg
 
-        except subprocess.TimeoutExpired:
-            error_msg = "rclone copy operation timed out"
-            self.logger.error(error_msg)
-            return False, 0, error_msg
         except subprocess.SubprocessError as e:
             error_msg = f"rclone copy subprocess error: {e}"
             self.logger.error(error_msg)
             return False, 0, error_msg
+        finally:
+            if manifest is not None:
+                os.unlink(manifest)
 
-    def _parse_rclone_output(self, output: str) -> int:
-        """Parse rclone output to extract bytes transferred."""
-        # Look for lines like "Transferred: 1.234 MiB / 1.234 MiB, 100%, 0 B/s, ETA -"
-        bytes_transferred = 0
-        for line in output.split("\n"):
-            if "Transferred:" in line:
-                try:
-                    # Extract the transferred amount
-                    parts = line.split("Transferred:")[1].split("/")[0].strip()
-                    # This is a simplified parser - in practice, you might want more robust parsing
-                    if "MiB" in parts:
-                        amount = float(parts.replace("MiB", "").strip())
-                        bytes_transferred = int(amount * 1024 * 1024)
-                    elif "GiB" in parts:
-                        amount = float(parts.replace("GiB", "").strip())
-                        bytes_transferred = int(amount * 1024 * 1024 * 1024)
-                    elif "KiB" in parts:
-                        amount = float(parts.replace("KiB", "").strip())
-                        bytes_transferred = int(amount * 1024)
-                    elif "B" in parts:
-                        bytes_transferred = int(parts.replace("B", "").strip())
-                except (ValueError, IndexError):
-                    continue
-        return bytes_transferred
+    @staticmethod
+    def _write_manifest(source_dir: str, files_list: list[str]) -> str:
+        """
+        Write files_list relative to source_dir, one per line, to a temp file.
+
+        Paths inside a .recycle directory are dropped here as well, so the
+        manifest matches the --exclude rule on its own. Returns the file name;
+        the caller deletes it.
+        """
+        prefix = os.path.join(source_dir, "")
+        with tempfile.NamedTemporaryFile(
+            mode="w", prefix="rclone-files-", suffix=".txt", delete=False
+        ) as f:
+            for path in files_list:
+                rel = path[len(prefix) :] if path.startswith(prefix) else path
+                if "/.recycle/" not in f"/{rel}":
+                    f.write(f"{rel}\n")
+        return f.name
+
+    @staticmethod
+    def _parse_log_line(line: str) -> dict:
+        """Decode one --use-json-log line; plain text becomes {"msg": line}."""
+        if line.startswith("{"):
+            try:
+                record = json_loads(line)
+                if isinstance(record, dict):
+                    return record
+            except JSONDecodeError:
+                pass
+        return {"msg": line.rstrip("\n")}
+
+    @staticmethod
+    def _format_log_record(record: dict) -> str:
+        """Render a log record as "level: object: msg", skipping absent keys."""
+        parts = [str(record[key]) for key in ("level", "object") if record.get(key)]
+        parts.append(str(record.get("msg", "")))
+        return ": ".join(parts)
 
     def list_remote_directories(self, remote_path: str) -> list[str]:
-        """List directories in a remote path."""
+        """
+        List directories in a remote path.
+
+        Successful listings are cached for the lifetime of the manager.
+        """
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(remote_path)
+        if cached is not None:
+            return list(cached)
+
+        directories = self._fetch_remote_directories(remote_path)
+        if directories is None:
+            return []
+        with self._dir_cache_lock:
+            self._dir_cache[remote_path] = directories
+        return list(directories)
+
+    def _update_dir_cache(self, dir_path: str, present: bool) -> None:
+        """Add or remove dir_path in its parent's cached listing, if any."""
+        parent, _, name = dir_path.rstrip("/").rpartition("/")
+        with self._dir_cache_lock:
+            listing = self._dir_cache.get(parent)
+            if listing is None:
+                return
+            if present and name not in listing:
+                listing.append(name)
+            elif not present and name in listing:
+                listing.remove(name)
+
+    def _fetch_remote_directories(self, remote_path: str) -> list[str] | None:
+        if self._rc is not None:
+            try:
+                listing = self._rc.call(
+                    "operations/list",
+                    fs=remote_path,
+                    remote="",
+                    opt={"dirsOnly": True},
+                )
+            except _RcloneRCError as e:
+                self.logger.error(f"rclone lsd failed for '{remote_path}': {e}")
+                return None
+            if listing is not None:
+                return [item["Name"] for item in listing.get("list", [])]
         try:
+            # lsjson rather than lsd: names come back intact, spaces included
             result = subprocess.run(
-                ["rclone", "lsd", remote_path],
+                ["rclone", "lsjson", "--dirs-only", remote_path],
                 capture_output=True,
-                text=True,
                 timeout=60,
             )
 
             if result.returncode == 0:
-                directories = []
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        # Parse directory name from rclone lsd output
-                        parts = line.split()
-                        if parts:
-                            directories.append(parts[-1])
-                return directories
+                return [entry["Name"] for entry in json_loads(result.stdout)]
             else:
-                self.logger.error(
-                    f"rclone lsd failed for '{remote_path}': {result.stderr}"
-                )
-                return []
+                stderr = result.stderr.decode(errors="replace")
+                self.logger.error(f"rclone lsjson failed for '{remote_path}': {stderr}")
+                return None
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except (
+            subprocess.TimeoutExpired,
+            JSONDecodeError,
+            subprocess.SubprocessError,
+        ) as e:
             self.logger.error(f"Error listing remote directories '{remote_path}': {e}")
-            return []
+            return None
 
     def delete_remote_directory(self, remote_path: str) -> bool:
         """Delete a remote directory."""
+        if self._rc is not None:
+            try:
+                deleted = self._rc.call(
+                    "operations/purge", timeout=300, fs=remote_path, remote=""
+                )
+            except _RcloneRCError as e:
+                self.logger.error(
+                    f"Failed to delete remote directory '{remote_path}': {e}"
+                )
+                return False
+            if deleted is not None:
+                self.logger.info(
+                    f"Successfully deleted remote directory: {remote_path}"
+                )
+                self._update_dir_cache(remote_path, present=False)
+                return True
         try:
             result = subprocess.run(
                 ["rclone", "purge", remote_path],
@@ -418,6 +926,7 @@ class RcloneManager:
                 self.logger.info(
                     f"Successfully deleted remote directory: {remote_path}"
                 )
+                self._update_dir_cache(remote_path, present=False)
                 return True
             else:
                 self.logger.error(
@@ -455,65 +964,79 @@ class LocalBackupManager:
             return False
 
     def copy_to_local(
-        self, source_dir: str, destination: str, max_age_days: int = 0
+        self,
+        source_dir: str,
+        destination: str,
+        max_age_days: int = 0,
+        link_dest: str | None = None,
     ) -> tuple[bool, int, str]:
         """
         Copy files from source to local destination.
 
+        With link_dest, the previous backup of the same source, files whose
+        size and mtime are unchanged there are hard-linked instead of copied
+        and count as 0 bytes transferred.
+
         Returns:
             Tuple of (success, bytes_transferred, error_message)
         """
         try:
             source_path = Path(source_dir)
-            dest_path = Path(destination)
 
             if not source_path.exists():
                 return False, 0, f"Source directory does not exist: {source_dir}"
 
-            # Get files to backup based on age criteria
-            if max_age_days > 0:
-                files_to_backup = [
-                    file_path
-                    for file_path, _, _ in get_files_modified_within_days(
-                        source_dir, max_age_days, include_subdirs=True
-                    )
-                ]
-            else:
-                # Get all files recursively
-                files_to_backup = [
-                    str(p) for p in source_path.rglob("*") if p.is_file()
-                ]
-
-            if not files_to_backup:
-                self.logger.warning(f"No files found to backup from {source_dir}")
-                return True, 0, ""
-
-            # Calculate total bytes to transfer
-            # Calculate total bytes to transfer from file paths
-            total_bytes = sum(Path(f).stat().st_size for f in files_to_backup)
-
-            # Create destination directory
-            dest_path.mkdir(parents=True, exist_ok=True)
-
-            # Copy files while preserving structure
+            # Copy files as the walk finds them, so traversal overlaps with
+            # copy I/O. At most two copies per worker are queued, which keeps
+            # memory bounded on very large trees. Parent directories are
+            # created here, before submitting, so workers never race on mkdir.
+            workers = self.config.local_copy_workers
+            # Walk paths all start with source_dir as given, so plain string
+            # slicing replaces a Path.relative_to per file
+            src_prefix_len = len(os.path.join(source_dir, ""))
+            created_dirs: set[str] = set()
+            pending: set[Future[int]] = set()
+            file_count = 0
             bytes_transferred = 0
-            for file_path in files_to_backup:
-                src_file = Path(file_path)
 
-                # Calculate relative path from source
-                rel_path = src_file.relative_to(source_path)
-                dest_file = dest_path / rel_path
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="local-copy"
+            ) as executor:
+                for file_path, size, mtime in iter_backup_candidates(
+                    source_dir, max_age_days
+                ):
+                    # Calculate relative path from source, preserving structure
+                    rel_path = file_path[src_prefix_len:]
+                    dest_file = os.path.join(destination, rel_path)
+                    dest_parent = os.path.dirname(dest_file)
+                    if dest_parent not in created_dirs:
+                        os.makedirs(dest_parent, exist_ok=True)
+                        created_dirs.add(dest_parent)
+
+                    if link_dest is None:
+                        future = executor.submit(_fast_copy, file_path, dest_file)
+                    else:
+                        future = executor.submit(
+                            _link_or_copy,
+                            file_path,
+                            dest_file,
+                            size,
+                            mtime,
+                            os.path.join(link_dest, rel_path),
+                        )
+                    pending.add(future)
+                    file_count += 1
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        bytes_transferred += sum(f.result() for f in done)
 
-                # Create parent directories
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
+                bytes_transferred += sum(f.result() for f in wait(pending).done)
 
-                # Copy file
-                shutil.copy2(src_file, dest_file)
-                bytes_transferred += src_file.stat().st_size
+            if not file_count:
+                self.logger.warning(f"No files found to backup from {source_dir}")
+                return True, 0, ""
 
-            self.logger.info(
-                f"Copied {len(files_to_backup)} files ({bytes_transferred} bytes)"
-            )
+            self.logger.info(f"Copied {file_count} files ({bytes_transferred} bytes)")
             return True, bytes_transferred, ""
 
         except Exception as e:
@@ -569,6 +1092,17 @@ class BackupManager:
             self.local_manager = None
 
         self.logger = logging.getLogger(__name__)
+        # One scan per (source_dir, max_age) per run; see _scan()
+        self._scan_cache: dict[tuple[str, int], ScanResult] = {}
+        # One lock per destination so parallel backups never share a target
+        self._destination_locks: defaultdict[str, threading.Lock] = defaultdict(
+            threading.Lock
+        )
+
+    def close(self) -> None:
+        """Release background resources such as the rclone rc server."""
+        if self.rclone is not None:
+            self.rclone.close()
 
     def perform_preflight_checks(self, backup_list: list[BackupItem]) -> list[str]:
         """
@@ -578,6 +1112,7 @@ class BackupManager:
             List of error messages (empty if all checks pass)
         """
         errors = []
+        remote_checks: dict[str, Future[bool]] = {}
 
         if self.is_local_mode:
             # Local mode checks
@@ -598,42 +1133,81 @@ class BackupManager:
                         f"Backup '{backup_item.name}' rclone_path must include a remote name (e.g., 'remote:/path')"
                     )
 
-            # Check remote storage space (skip in local mode as requested)
-            checked_remotes = set()
-            for backup_item in backup_list:
-                if ":" in backup_item.rclone_path:  # Only if valid format
-                    remote_name = backup_item.remote_name
-                    if remote_name not in checked_remotes:
-                        if not self.rclone.check_remote_space(remote_name):
-                            errors.append(
-                                f"Remote '{remote_name}' has insufficient free space or is not accessible"
-                            )
-                        checked_remotes.add(remote_name)
-
-        # Check source directories (common to both modes)
+            # Check remote storage space (skip in local mode as requested).
+            # 'rclone about' is a network round-trip, so it runs in the
+            # background while the local source checks below proceed.
+            remotes = dict.fromkeys(
+                backup_item.remote_name
+                for backup_item in backup_list
+                if ":" in backup_item.rclone_path  # Only if valid format
+            )
+            if remotes:
+                remote_pool = ThreadPoolExecutor(
+                    max_workers=len(remotes), thread_name_prefix="rclone-about"
+                )
+                remote_checks = {
+                    remote_name: remote_pool.submit(
+                        self.rclone.check_remote_space, remote_name
+                    )
+                    for remote_name in remotes
+                }
+                remote_pool.shutdown(wait=False)
+
+        source_errors = self._check_sources(backup_list)
+
+        for remote_name, check in remote_checks.items():
+            if not check.result():
+                errors.append(
+                    f"Remote '{remote_name}' has insufficient free space or is not accessible"
+                )
+
+        errors.extend(source_errors)
+        return errors
+
+    def _check_sources(self, backup_list: list[BackupItem]) -> list[str]:
+        """Check source directory accessibility and sizes (common to both modes)."""
+        errors = []
+
+        # Check source directories; items sharing a source check it once
+        accessible = []
+        source_ok: dict[str, bool] = {}
         for backup_item in backup_list:
-            if not is_directory_accessible(backup_item.source_dir):
+            ok = source_ok.get(backup_item.source_dir)
+            if ok is None:
+                ok = source_ok[backup_item.source_dir] = is_directory_accessible(
+                    backup_item.source_dir
+                )
+            if ok:
+                accessible.append(backup_item)
+            else:
                 errors.append(
                     f"Source directory not accessible for backup '{backup_item.name}': {backup_item.source_dir}"
                 )
 
+        # Scan the sources concurrently; the walks are I/O-bound and independent.
+        # Items with the same (source_dir, max_age) share one scan.
+        scans: dict[tuple[str, int], Future[ScanResult]] = {}
+        if accessible:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(accessible)),
+                thread_name_prefix="preflight-scan",
+            ) as pool:
+                for backup_item in accessible:
+                    key = (backup_item.source_dir, backup_item.max_age)
+                    if key not in scans:
+                        scans[key] = pool.submit(self._scan, backup_item)
+
         # Check source directory sizes
-        for backup_item in backup_list:
+        for backup_item in accessible:
             try:
-                if is_directory_accessible(backup_item.source_dir):
-                    # Get files within age criteria
-                    files_to_backup = get_files_modified_within_days(
-                        backup_item.source_dir,
-                        backup_item.max_age,
-                        include_subdirs=True,
+                # Get files within age criteria
+                scan = scans[(backup_item.source_dir, backup_item.max_age)].result()
+                if scan.total_size > backup_item.max_size_bytes:
+                    # Log warning but do not add to errors - will be skipped during execution
+                    self.logger.warning(
+                        f"Backup '{backup_item.name}' size exceeds limit: "
+                        f"{scan.total_size} bytes (limit: {backup_item.max_size_bytes} bytes) - will be SKIPPED"
                     )
-                    total_size = calculate_total_size(files_to_backup)
-                    if total_size > backup_item.max_size_bytes:
-                        # Log warning but do not add to errors - will be skipped during execution
-                        self.logger.warning(
-                            f"Backup '{backup_item.name}' size exceeds limit: "
-                            f"{total_size} bytes (limit: {backup_item.max_size_bytes} bytes) - will be SKIPPED"
-                        )
             except Exception as e:
                 errors.append(
                     f"Error calculating size for backup '{backup_item.name}': {e}"
@@ -641,25 +1215,82 @@ class BackupManager:
 
         return errors
 
+    def _scan(self, backup_item: BackupItem, refresh: bool = False) -> ScanResult:
+        """
+        Return the age-filtered scan of a backup's source directory.
+
+        The per-backup size check, the rclone file manifest and the latest
+        file date share one walk, cached by source and age. Pre-flight fills
+        the cache too, but backups may start hours later, so each backup
+        passes refresh=True to walk again first. The scan is not capped by
+        max_size_bytes.
+        """
+        key = (backup_item.source_dir, backup_item.max_age)
+        scan = None if refresh else self._scan_cache.get(key)
+        if scan is None:
+            files, _, _, total_size, max_mtime = analyze_backup_files(*key)
+            scan = self._scan_cache[key] = ScanResult(files, total_size, max_mtime)
+        return scan
+
+    def create_backups(
+        self, backup_list: list[BackupItem], max_parallel: int = 1
+    ) -> list[BackupResult]:
+        """
+        Run several backups, up to max_parallel at a time.
+
+        In rclone mode items are grouped by remote. Groups run in parallel and
+        the items of a group run one after another, so no remote gets two
+        concurrent copies from this process. Results keep the input order.
+        """
+        if max_parallel <= 1 or len(backup_list) <= 1:
+            return [self.create_backup(backup_item) for backup_item in backup_list]
+
+        groups: defaultdict[str, list[int]] = defaultdict(list)
+        for index, backup_item in enumerate(backup_list):
+            key = backup_item.name if self.is_local_mode else backup_item.remote_name
+            groups[key].append(index)
+
+        results: list[BackupResult | None] = [None] * len(backup_list)
+
+        def run_group(indices: list[int]) -> None:
+            for index in indices:
+                results[index] = self.create_backup(backup_list[index])
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_parallel, len(groups)), thread_name_prefix="backup"
+        ) as executor:
+            futures = [executor.submit(run_group, group) for group in groups.values()]
+            for future in futures:
+                future.result()
+
+        return results
+
     def create_backup(self, backup_item: BackupItem) -> BackupResult:
         """Create a single backup."""
-        start_time = datetime.now()
+        # Items sharing an rclone_path write and clean up under the same
+        # remote prefix, so they are serialized even when run in parallel
+        key = backup_item.name if self.is_local_mode else backup_item.rclone_path
+        with self._destination_locks[key]:
+            return self._create_backup(backup_item)
+
+    def _create_backup(self, backup_item: BackupItem) -> BackupResult:
+        start_time = datetime.now()  # Wall clock, for the destination timestamp
+        start_monotonic = time.monotonic()
         self.logger.info(f"Starting backup: {backup_item.name}")
 
         # Check if backup size exceeds limit and skip if so
         try:
             if is_directory_accessible(backup_item.source_dir):
-                files_to_backup = get_files_modified_within_days(
-                    backup_item.source_dir, backup_item.max_age, include_subdirs=True
-                )
-                total_size = calculate_total_size(files_to_backup)
+                # Rescan: the pre-flight scan may be hours old by now, and the
+                # copy below sends exactly these files
+                total_size = self._scan(backup_item, refresh=True).total_size
 
                 if total_size > backup_item.max_size_bytes:
                     self.logger.warning(
                         f"Skipping backup '{backup_item.name}' - size exceeds limit: "
                         f"{total_size} bytes (limit: {backup_item.max_size_bytes} bytes)"
                     )
-                    execution_time = (datetime.now() - start_time).total_seconds()
+                    execution_time = time.monotonic() - start_monotonic
                     return BackupResult(
                         backup_name=backup_item.name,
                         success=True,  # Consider as success since we intentionally skipped
@@ -685,7 +1316,10 @@ class BackupManager:
                 # Perform the backup
                 success, bytes_transferred, error_message = (
                     self.local_manager.copy_to_local(
-                        backup_item.source_dir, destination, backup_item.max_age
+                        backup_item.source_dir,
+                        destination,
+                        backup_item.max_age,
+                        link_dest=self._previous_local_backup(backup_item, timestamp),
                     )
                 )
             else:
@@ -693,34 +1327,32 @@ class BackupManager:
                 destination = f"{backup_item.rclone_path}_{timestamp}"
 
                 # Perform the backup
+                scan = self._scan(backup_item)
+                avg_file_size = (
+                    scan.total_size / len(scan.files) if scan.files else None
+                )
                 success, bytes_transferred, error_message = self.rclone.copy_to_remote(
-                    backup_item.source_dir, destination, backup_item.max_age
+                    backup_item.source_dir,
+                    destination,
+                    backup_item.max_age,
+                    avg_file_size=avg_file_size,
+                    files_list=scan.files,
                 )
 
             # Get latest file date if backup was successful
             latest_file_date = None
             if success and is_directory_accessible(backup_item.source_dir):
                 try:
-                    files_to_backup = get_files_modified_within_days(
-                        backup_item.source_dir,
-                        backup_item.max_age,
-                        include_subdirs=True,
-                    )
-                    if files_to_backup:
-                        # Extract file paths from tuples (path, size, mtime) and get latest modification time
-                        file_paths = [
-                            file_info[0] for file_info in files_to_backup
-                        ]  # Get path from tuple
-                        latest_file_date = max(
-                            Path(f).stat().st_mtime for f in file_paths
-                        )
-                        latest_file_date = datetime.fromtimestamp(latest_file_date)
+                    # Reuses the scan from the size check; no extra walk
+                    max_mtime = self._scan(backup_item).max_mtime
+                    if max_mtime is not None:
+                        latest_file_date = datetime.fromtimestamp(max_mtime)
                 except Exception as e:
                     self.logger.warning(
                         f"Could not determine latest file date for {backup_item.name}: {e}"
                     )
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_monotonic
 
             result = BackupResult(
                 backup_name=backup_item.name,
@@ -746,7 +1378,7 @@ class BackupManager:
             return result
 
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_monotonic
             error_message = f"Unexpected error during backup: {e}"
             self.logger.error(error_message)
 
@@ -757,6 +1389,25 @@ class BackupManager:
                 execution_time=execution_time,
             )
 
+    def _previous_local_backup(
+        self, backup_item: BackupItem, timestamp: str
+    ) -> str | None:
+        """Newest local backup older than timestamp, if linking is enabled."""
+        if not self.config.local_link_unchanged:
+            return None
+        existing = [
+            entry
+            for entry in _timestamped_dirs(
+                self.local_manager.list_local_directories(self.local_destination),
+                backup_item.name,
+            )
+            if entry[1] < timestamp
+        ]
+        if not existing:
+            return None
+        dir_name, _ = max(existing, key=itemgetter(1))
+        return os.path.join(self.local_destination, dir_name)
+
     def _cleanup_old_backups(self, backup_item: BackupItem) -> None:
         """Clean up old backup directories based on retention policy."""
         try:
@@ -770,30 +1421,18 @@ class BackupManager:
                 )
 
                 # Filter directories that match this backup
-                backup_dirs = []
-                for dir_name in existing_dirs:
-                    if (
-                        dir_name.startswith(f"{backup_name}_")
-                        and len(dir_name) > len(backup_name) + 1
-                    ):
-                        # Validate timestamp format
-                        timestamp_part = dir_name[len(backup_name) + 1 :]
-                        try:
-                            datetime.strptime(timestamp_part, "%Y-%m-%d_%H-%M")
-                            backup_dirs.append((dir_name, timestamp_part))
-                        except ValueError:
-                            continue
+                backup_dirs = _timestamped_dirs(existing_dirs, backup_name)
 
                 # Sort by timestamp (newest first)
-                backup_dirs.sort(key=lambda x: x[1], reverse=True)
+                backup_dirs.sort(key=itemgetter(1), reverse=True)
 
                 # Delete old backups beyond retention limit
                 if len(backup_dirs) > backup_item.retention:
                     dirs_to_delete = backup_dirs[backup_item.retention :]
-                    for dir_name, _ in dirs_to_delete:
-                        full_path = str(parent_path / dir_name)
-                        self.logger.info(f"Deleting old backup: {full_path}")
-                        self.local_manager.delete_local_directory(full_path)
+                    self._delete_old_backups(
+                        [str(parent_path / dir_name) for dir_name, _ in dirs_to_delete],
+                        self.local_manager.delete_local_directory,
+                    )
 
             else:
                 # Rclone cleanup (original logic)
@@ -806,38 +1445,47 @@ class BackupManager:
                 existing_dirs = self.rclone.list_remote_directories(parent_path)
 
                 # Filter directories that match this backup
-                backup_dirs = []
-                for dir_name in existing_dirs:
-                    if (
-                        dir_name.startswith(f"{backup_name}_")
-                        and len(dir_name) > len(backup_name) + 1
-                    ):
-                        # Validate timestamp format
-                        timestamp_part = dir_name[len(backup_name) + 1 :]
-                        try:
-                            datetime.strptime(timestamp_part, "%Y-%m-%d_%H-%M")
-                            backup_dirs.append((dir_name, timestamp_part))
-                        except ValueError:
-                            continue
+                backup_dirs = _timestamped_dirs(existing_dirs, backup_name)
 
                 # Sort by timestamp (newest first)
-                backup_dirs.sort(key=lambda x: x[1], reverse=True)
+                backup_dirs.sort(key=itemgetter(1), reverse=True)
 
                 # Delete old backups beyond retention limit
                 if len(backup_dirs) > backup_item.retention:
                     dirs_to_delete = backup_dirs[backup_item.retention :]
-                    for dir_name, _ in dirs_to_delete:
-                        full_path = f"{parent_path}/{dir_name}"
-                        self.logger.info(f"Deleting old backup: {full_path}")
-                        self.rclone.delete_remote_directory(full_path)
+                    self._delete_old_backups(
+                        [f"{parent_path}/{dir_name}" for dir_name, _ in dirs_to_delete],
+                        self.rclone.delete_remote_directory,
+                    )
 
         except Exception as e:
             self.logger.warning(
                 f"Error during cleanup for backup '{backup_item.name}': {e}"
             )
 
-    def create_backup_dry_run(self, backup_item: BackupItem) -> DryRunResult:
-        """Perform dry run analysis for a backup item."""
+    def _delete_old_backups(
+        self, paths: list[str], delete: Callable[[str], bool]
+    ) -> None:
+        """Delete expired backup directories, up to 4 at a time."""
+        for path in paths:
+            self.logger.info(f"Deleting old backup: {path}")
+        if len(paths) == 1:
+            delete(paths[0])
+            return
+        # Each delete is an independent rmtree or 'rclone purge'
+        with ThreadPoolExecutor(
+            max_workers=min(4, len(paths)), thread_name_prefix="cleanup"
+        ) as pool:
+            list(pool.map(delete, paths))
+
+    def create_backup_dry_run(
+        self, backup_item: BackupItem, include_excluded_paths: bool = False
+    ) -> DryRunResult:
+        """
+        Perform dry run analysis for a backup item.
+
+        Excluded files are only counted unless include_excluded_paths is set.
+        """
         self.logger.info(f"Analyzing backup: {backup_item.name}")
 
         try:
@@ -852,8 +1500,13 @@ class BackupManager:
                 destination_type = "remote"
 
             # Analyze files that would be copied
-            files_to_copy, excluded_files, total_size = analyze_backup_files(
-                backup_item.source_dir, backup_item.max_age, backup_item.max_size_bytes
+            files_to_copy, excluded_files, excluded_count, total_size, _ = (
+                analyze_backup_files(
+                    backup_item.source_dir,
+                    backup_item.max_age,
+                    backup_item.max_size_bytes,
+                    include_excluded_paths,
+                )
             )
 
             total_files = len(files_to_copy)
@@ -871,6 +1524,7 @@ class BackupManager:
                 total_size=total_size,
                 filtered_files=files_to_copy,
                 excluded_files=excluded_files,
+                excluded_count=excluded_count,
                 success=True,
             )
 
@@ -894,9 +1548,15 @@ class BackupManager:
 
         summary = DryRunSummary()
 
-        for backup_item in backup_list:
-            result = self.create_backup_dry_run(backup_item)
-            summary.add_result(result)
+        # Each analysis is an independent, I/O-bound walk; map() keeps the
+        # results in configuration order
+        if backup_list:
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(backup_list)),
+                thread_name_prefix="dry-run",
+            ) as pool:
+                for result in pool.map(self.create_backup_dry_run, backup_list):
+                    summary.add_result(result)
 
         self.logger.info(
             f"Dry run analysis complete: {summary.successful_backups} successful, "
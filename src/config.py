@@ -2,19 +2,56 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import string
+import sys
 from pathlib import Path
 
 import yaml
 from croniter import croniter
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from python_utils.size_utils import parse_size_to_bytes
 
+# Prefer the libyaml C parser; fall back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Every character croniter can accept; anything else is rejected up front
+_CRON_CHARS = frozenset(
+    string.ascii_letters + string.digits + string.whitespace + "#*,-/?@"
+)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_size(size: str) -> int:
+    """parse_size_to_bytes, once per distinct size string."""
+    return parse_size_to_bytes(size)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_schedule(schedule: str) -> croniter:
+    """
+    Parse a cron expression, once per distinct string.
+
+    Validation and every schedule check share the result. It must not be
+    advanced in place; copy it and set_current() the copy instead.
+    """
+    # Cheap reject before croniter's tokenizer and its exception paths
+    if not _CRON_CHARS.issuperset(schedule):
+        raise ValueError(f"unexpected characters in {schedule!r}")
+    return croniter(schedule)
+
 
 class ChecksConfig(BaseModel):
     """System checks configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     min_free_space: str = Field(
         default="200GB", description="Minimum free space required on remote storage"
     )
@@ -24,15 +61,55 @@ class ChecksConfig(BaseModel):
     def validate_min_free_space(cls, v: str) -> str:
         """Validate the min_free_space format."""
         try:
-            parse_size_to_bytes(v)
+            _parse_size(v)
             return v
         except Exception as e:
             raise ValueError(f"Invalid size format for min_free_space: {e}")
 
 
+class RcloneConfig(BaseModel):
+    """Tuning options passed to 'rclone copy'."""
+
+    model_config = ConfigDict(frozen=True)
+
+    transfers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Parallel file transfers (default: chosen by average file size)",
+    )
+    checkers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Parallel checkers (default: chosen by average file size)",
+    )
+    multi_thread_streams: int | None = Field(
+        default=None,
+        ge=0,
+        description="Streams per large file (default: chosen by average file size)",
+    )
+    multi_thread_cutoff: str = Field(
+        default="50M",
+        description="Files above this size are sent with multiple streams",
+    )
+    buffer_size: str | None = Field(
+        default=None,
+        description="In-memory read-ahead per transfer (default: rclone's own)",
+    )
+    fast_list: bool = Field(
+        default=False,
+        description="Use --fast-list (fewer listing calls, more memory)",
+    )
+    rc_server: bool = Field(
+        default=False,
+        description="Serve version/about/list/purge calls from one 'rclone rcd'",
+    )
+
+
 class BackupItem(BaseModel):
     """Configuration for a single backup item."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Short name/identifier for the backup")
     source_dir: str = Field(description="Path to the source directory")
     rclone_path: str = Field(description="Path to the rclone directory")
@@ -59,7 +136,7 @@ class BackupItem(BaseModel):
     def validate_max_size(cls, v: str) -> str:
         """Validate the max_size format."""
         try:
-            parse_size_to_bytes(v)
+            _parse_size(v)
             return v
         except Exception as e:
             raise ValueError(f"Invalid size format for max_size: {e}")
@@ -69,18 +146,22 @@ class BackupItem(BaseModel):
     def validate_schedule(cls, v: str) -> str:
         """Validate the cron schedule format."""
         # Remove extra whitespace and split
-        schedule_parts = v.strip().split()
+        schedule_parts = v.split()
 
         if len(schedule_parts) != 5:
             raise ValueError(
                 "Schedule must have 5 fields: 'minute hour day-of-month month day-of-week'"
             )
 
-        # Validate cron syntax using croniter
+        # Validate cron syntax using croniter; the stored form is
+        # single-spaced, so schedule checks can use it as is
+        normalized = " ".join(schedule_parts)
         try:
-            # Create a test cron expression to validate syntax
-            croniter(v)
-            return v
+            # Parsing here also warms the cache used by ScheduleChecker
+            parse_schedule(normalized)
+            # Items sharing a schedule share one string object, so cache
+            # lookups keyed on it succeed on the identity check
+            return sys.intern(normalized)
         except Exception as e:
             raise ValueError(f"Invalid cron schedule format: {e}")
 
@@ -103,7 +184,7 @@ class BackupItem(BaseModel):
     @property
     def max_size_bytes(self) -> int:
         """Get max_size as bytes."""
-        return parse_size_to_bytes(self.max_size)
+        return _parse_size(self.max_size)
 
     @property
     def remote_name(self) -> str:
@@ -114,6 +195,8 @@ class BackupItem(BaseModel):
 class AppConfig(BaseModel):
     """Main application configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     email: list[str] = Field(
         default_factory=list, description="List of emails to send notifications to"
     )
@@ -126,6 +209,21 @@ class AppConfig(BaseModel):
         description="Path to log file relative to project root",
     )
     checks: ChecksConfig = Field(default_factory=ChecksConfig)
+    rclone: RcloneConfig = Field(default_factory=RcloneConfig)
+    max_parallel_backups: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of backups to run concurrently",
+    )
+    local_copy_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Number of files copied concurrently in local mode",
+    )
+    local_link_unchanged: bool = Field(
+        default=False,
+        description="Hard-link files unchanged since the previous local backup",
+    )
     backup_copy_list: list[BackupItem] = Field(
         description="List of directories to copy to remote storage"
     )
@@ -144,9 +242,9 @@ class AppConfig(BaseModel):
     @classmethod
     def validate_email_list(cls, v: list[str]) -> list[str]:
         """Validate email addresses."""
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
         for email in v:
-            if not email_pattern.match(email):
+            # The '@' test rejects obvious non-addresses before the regex
+            if "@" not in email or not _EMAIL_RE.match(email):
                 raise ValueError(f"Invalid email format: {email}")
         return v
 
@@ -161,19 +259,38 @@ class AppConfig(BaseModel):
     @property
     def min_free_space_bytes(self) -> int:
         """Get minimum free space as bytes."""
-        return parse_size_to_bytes(self.checks.min_free_space)
+        return _parse_size(self.checks.min_free_space)
 
 
 def load_config(config_path: str = "config.yaml") -> AppConfig:
-    """Load and validate configuration from YAML file."""
+    """
+    Load and validate configuration from YAML file.
+
+    The parsed result is cached per (path, mtime, size), so reloading an
+    unchanged file skips YAML parsing and validation. Each call returns a
+    deep copy, so callers cannot mutate the cached AppConfig.
+    """
     config_file = Path(config_path)
 
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    cached = _load_config_cached(
+        str(config_file.resolve()), stat.st_mtime_ns, stat.st_size
+    )
+    # frozen=True only blocks attribute assignment; the list fields (email,
+    # backup_copy_list) would still be shared and mutable without the copy
+    return cached.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse and validate the configuration file (cached by load_config)."""
     try:
-        with open(config_file, encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+        with open(config_path, encoding="utf-8") as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
 
         if config_data is None:
             raise ValueError("Configuration file is empty")
@@ -0,0 +1,60 @@
+"""Human-readable formatting helpers for sizes, durations and estimates.
+
+Kept free of heavy imports so the CLI can use them without loading the
+backup machinery.
+"""
+
+import functools
+
+
+def estimate_transfer_time(total_size: int, destination_type: str = "remote") -> float:
+    """
+    Estimate transfer time based on size and destination type.
+
+    Args:
+        total_size: Total size in bytes
+        destination_type: "remote" or "local"
+
+    Returns:
+        Estimated time in seconds
+    """
+    if total_size == 0:
+        return 0.0
+
+    # Transfer rate estimates (bytes per second)
+    if destination_type == "local":
+        # Local disk transfer (SSD/HDD average)
+        rate_bps = 50 * 1024 * 1024  # 50 MB/s
+    else:
+        # Remote transfer (internet upload)
+        rate_bps = 5 * 1024 * 1024  # 5 MB/s (conservative estimate)
+
+    return total_size / rate_bps
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@functools.lru_cache(maxsize=256)
+def format_size(size_bytes: int) -> str:
+    """Format byte size in human-readable format."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+
+    # Each unit is 2**10 of the previous one, so the unit index is read off
+    # the bit length instead of dividing in a loop
+    magnitude = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (magnitude * 10)):.1f} {_SIZE_UNITS[magnitude]}"
+
+
+def format_duration(seconds: float) -> str:
+    """Format duration in human-readable format."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    elif seconds < 3600:
+        minutes = seconds / 60
+        return f"{minutes:.0f}m {seconds % 60:.0f}s"
+    else:
+        hours = seconds / 3600
+        minutes = (seconds % 3600) / 60
+        return f"{hours:.0f}h {minutes:.0f}m"
@@ -1,10 +1,101 @@
 """Schedule checking logic for cron-based backup scheduling."""
 
-from datetime import datetime
+import copy
+import functools
+import logging
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from croniter import croniter
 
-from .config import BackupItem
+from .config import BackupItem, parse_schedule
+
+# A child of the app logger, so records reach the handlers main.setup_logging
+# attaches there
+logger = logging.getLogger("rclone-copy").getChild(__name__)
+
+
+def _cron_at(schedule: str, start_time: datetime) -> croniter:
+    """Return a croniter for schedule starting at start_time, without re-parsing."""
+    cron = copy.copy(parse_schedule(schedule))
+    cron.set_current(start_time, force=True)
+    return cron
+
+
+class _PlainSchedule(NamedTuple):
+    """A schedule reduced to bitmasks; bit n is set when value n matches."""
+
+    first_run: int  # Minutes after midnight of the earliest daily match
+    dom_bits: int
+    month_bits: int
+    dow_bits: int  # Sunday is bit 0
+    day_or: bool  # Both day fields are restricted; either may match
+
+
+def _bits(values: list) -> int:
+    """Pack expanded cron values into a bitmask; '*' sets every bit."""
+    if values == ["*"]:
+        return -1
+    bits = 0
+    for v in values:
+        bits |= 1 << v
+    return bits
+
+
+@functools.lru_cache(maxsize=256)
+def _plain_schedule(schedule: str) -> _PlainSchedule | None:
+    """
+    Reduce a schedule made only of plain values to bitmasks.
+
+    Ranges, steps and lists all expand to plain values. Schedules using
+    L, W or # need croniter's calendar logic and return None.
+    """
+    cron = parse_schedule(schedule)
+    expanded = cron.expanded
+    if (
+        len(expanded) != 5
+        or cron.nth_weekday_of_month
+        or getattr(cron, "nearest_weekday", None)
+        or not all(
+            values == ["*"] or all(isinstance(v, int) for v in values)
+            for values in expanded
+        )
+    ):
+        return None
+    minutes, hours, doms, months, dows = expanded
+
+    dow_bits = _bits(dows)
+    if dow_bits != -1 and dow_bits & (1 << 7):
+        dow_bits = (dow_bits | 1) & ~(1 << 7)  # 7 is also Sunday
+    return _PlainSchedule(
+        first_run=(0 if hours == ["*"] else min(hours)) * 60
+        + (0 if minutes == ["*"] else min(minutes)),
+        dom_bits=_bits(doms),
+        month_bits=_bits(months),
+        dow_bits=dow_bits,
+        day_or=doms != ["*"] and dows != ["*"],
+    )
+
+
+def _fired_today(plain: _PlainSchedule, current_time: datetime) -> bool:
+    """Whether a plain schedule matched between midnight and current_time."""
+    if not plain.month_bits >> current_time.month & 1:
+        return False
+
+    dom_ok = plain.dom_bits >> current_time.day & 1
+    dow_ok = plain.dow_bits >> current_time.isoweekday() % 7 & 1
+    # Like cron (and croniter's default), either day field may match when
+    # both are restricted
+    if not ((dom_ok or dow_ok) if plain.day_or else (dom_ok and dow_ok)):
+        return False
+
+    # first_run < current_time, compared as numbers instead of datetimes
+    now = current_time.hour * 60 + current_time.minute
+    return now > plain.first_run or (
+        now == plain.first_run
+        and (current_time.second > 0 or current_time.microsecond > 0)
+    )
 
 
 class ScheduleChecker:
@@ -12,7 +103,9 @@ class ScheduleChecker:
 
     @staticmethod
     def should_run_backup(
-        backup_item: BackupItem, current_time: datetime = None
+        backup_item: BackupItem,
+        current_time: datetime = None,
+        today_start: datetime = None,
     ) -> bool:
         """
         Check if a backup should run based on its cron schedule.
@@ -20,6 +113,8 @@ class ScheduleChecker:
         Args:
             backup_item: The backup configuration item
             current_time: Current time (defaults to now)
+            today_start: Midnight of current_time's day, when the caller
+                already has it
 
         Returns:
             True if backup should run today, False otherwise
@@ -27,24 +122,26 @@ class ScheduleChecker:
         if current_time is None:
             current_time = datetime.now()
 
-        schedule = backup_item.schedule.strip()
+        schedule = backup_item.schedule
 
         # Parse the cron expression
         try:
-            # Create croniter instance
-            cron = croniter(schedule, current_time)
-
-            # Get the previous occurrence (when this schedule last matched)
-            prev_occurrence = cron.get_prev(datetime)
+            # Day/month/weekday lists are answered by plain comparisons
+            plain = _plain_schedule(schedule)
+            if plain is not None:
+                return _fired_today(plain, current_time)
 
-            # Check if the previous occurrence was today
             # Since we run daily at 5 AM, we check if the cron would have
-            # triggered between midnight and now today
-            today_start = current_time.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+            # triggered between midnight and now today. Searching forward
+            # from just before midnight answers that without walking back
+            # from now through get_prev.
+            if today_start is None:
+                today_start = current_time.replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            cron = _cron_at(schedule, today_start - timedelta(seconds=1))
 
-            return prev_occurrence >= today_start
+            return cron.get_next(datetime) < current_time
 
         except Exception as e:
             raise ValueError(
@@ -52,36 +149,62 @@ class ScheduleChecker:
             )
 
     @staticmethod
-    def get_scheduled_backups(
+    def iter_scheduled(
         backup_list: list[BackupItem], current_time: datetime = None
-    ) -> list[BackupItem]:
+    ) -> Iterator[BackupItem]:
         """
-        Filter backup list to only include rclone-enabled items scheduled to run.
+        Yield the rclone-enabled backup items scheduled to run, in config order.
 
         Args:
             backup_list: List of all backup items
             current_time: Current time (defaults to now)
 
-        Returns:
-            List of backup items that should run today
+        Yields:
+            Backup items that should run today
         """
-        scheduled_backups = []
+        # One clock reading and one midnight for the whole list
+        if current_time is None:
+            current_time = datetime.now()
+        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Items sharing a schedule share its answer for this pass
+        due: dict[str, bool] = {}
 
         for backup_item in backup_list:
             # Skip backups that are disabled for rclone mode
             if not backup_item.rclone_enabled:
                 continue
             try:
-                if ScheduleChecker.should_run_backup(backup_item, current_time):
-                    scheduled_backups.append(backup_item)
+                run = due.get(backup_item.schedule)
+                if run is None:
+                    run = due[backup_item.schedule] = ScheduleChecker.should_run_backup(
+                        backup_item, current_time, today_start
+                    )
+                if run:
+                    yield backup_item
             except Exception as e:
                 # Log the error but don't stop processing other backups
-                print(
-                    f"Warning: Could not evaluate schedule for backup '{backup_item.name}': {e}"
+                logger.warning(
+                    "Could not evaluate schedule for backup '%s': %s",
+                    backup_item.name,
+                    e,
                 )
                 continue
 
-        return scheduled_backups
+    @staticmethod
+    def get_scheduled_backups(
+        backup_list: list[BackupItem], current_time: datetime = None
+    ) -> list[BackupItem]:
+        """
+        Filter backup list to only include rclone-enabled items scheduled to run.
+
+        Args:
+            backup_list: List of all backup items
+            current_time: Current time (defaults to now)
+
+        Returns:
+            List of backup items that should run today
+        """
+        return list(ScheduleChecker.iter_scheduled(backup_list, current_time))
 
     @staticmethod
     def next_run_time(
@@ -100,10 +223,10 @@ class ScheduleChecker:
         if current_time is None:
             current_time = datetime.now()
 
-        schedule = backup_item.schedule.strip()
+        schedule = backup_item.schedule
 
         try:
-            cron = croniter(schedule, current_time)
+            cron = _cron_at(schedule, current_time)
             return cron.get_next(datetime)
         except Exception as e:
             raise ValueError(
@@ -122,7 +245,7 @@ class ScheduleChecker:
             True if valid, False otherwise
         """
         try:
-            croniter(schedule.strip())
+            parse_schedule(schedule.strip())
             return True
         except Exception:
             return False